@@ -2,13 +2,16 @@
 API routes for metrics and monitoring.
 """
 import logging
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response
 from metrics import metrics_collector
+from api.responses import constant_json
 
 logger = logging.getLogger(__name__)
 
 metrics_bp = Blueprint('metrics', __name__)
 
+metrics_error = constant_json(b'{"error":"Failed to retrieve metrics"}', 500)
+
 
 @metrics_bp.route('/metrics', methods=['GET'])
 def get_metrics():
@@ -18,11 +21,11 @@ def get_metrics():
     Returns:
         JSON response with metrics data
     """
-    logger.info("Metrics requested")
+    logger.debug("Metrics requested")
     
     try:
-        metrics = metrics_collector.get_metrics()
-        return jsonify(metrics), 200
+        payload = metrics_collector.get_metrics_json()
+        return Response(payload, status=200, mimetype='application/json')
     except Exception as e:
         logger.error(f"Error retrieving metrics: {str(e)}", exc_info=True)
-        return jsonify({'error': 'Failed to retrieve metrics'}), 500
+        return metrics_error()
@@ -0,0 +1,75 @@
+"""
+Keyset pagination helpers shared by the list endpoints.
+
+Pages are addressed by an opaque cursor that encodes the sort key of the
+last row returned, so fetching a page costs O(limit) no matter how deep
+into the table it is.
+"""
+import base64
+import json
+from flask import request
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+def parse_page_args():
+    """
+    Read `limit` and `cursor` from the query string.
+
+    Returns:
+        (limit, cursor) where cursor is the decoded key list or None
+
+    Raises:
+        ValueError: If either parameter is malformed
+    """
+    limit = int(request.args.get('limit', DEFAULT_LIMIT))
+    if limit < 1:
+        raise ValueError('limit must be a positive integer')
+    limit = min(limit, MAX_LIMIT)
+
+    raw_cursor = request.args.get('cursor')
+    cursor = decode_cursor(raw_cursor) if raw_cursor else None
+
+    return limit, cursor
+
+def encode_cursor(key):
+    """Encode a sort key (list of JSON-safe values) as an opaque cursor."""
+    raw = json.dumps(key, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is not a valid two-part key
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as e:
+        raise ValueError('Invalid cursor') from e
+
+    if not isinstance(key, list) or len(key) != 2:
+        raise ValueError('Invalid cursor')
+
+    return key
+
+def page_response(rows, limit, dump, key_func):
+    """
+    Build the paginated response body.
+
+    Args:
+        rows: Model rows fetched with limit + 1 to detect a further page
+        limit: Requested page size
+        dump: Serializes a list of rows
+        key_func: Returns the cursor key for a row
+
+    Returns:
+        {"items": [...], "next_cursor": string | None}
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(key_func(rows[-1])) if has_more else None
+
+    return {'items': dump(rows), 'next_cursor': next_cursor}
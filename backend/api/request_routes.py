@@ -2,15 +2,20 @@
 Request API routes.
 """
 import logging
+from datetime import datetime
+import msgspec
 from flask import Blueprint, request, jsonify, g
-from marshmallow import ValidationError
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import raiseload, selectinload
 from models.request import Request
-from models.decision import Decision
 from schemas.request_schema import request_schema
+from schemas.structs import RequestIn
 from schemas.decision_schema import decision_schema
 from services.decision_service import DecisionService
 from database import db
 from metrics import metrics_collector
+from api.pagination import parse_page_args, page_response
+from api.responses import internal_error
 
 logger = logging.getLogger(__name__)
 
@@ -34,19 +39,21 @@ def submit_request():
         }
     """
     try:
-        # Validate input
-        data = request_schema.load(request.json)
-        logger.info(f"Received request submission: amount={data['amount']}, category={data['category']}")
+        # Decode and validate input in one pass
+        data = msgspec.json.decode(request.get_data(), type=RequestIn)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Received request submission: amount={data.amount}, category={data.category}")
         
-        # Create request
-        new_request = Request(
-            amount=data['amount'],
-            category=data['category'],
-            description=data.get('description')
-        )
+        # Both rows are dumped right after the commit and this request's
+        # session ends with it, so don't expire (and re-SELECT) them
+        db.session().expire_on_commit = False
         
+        # Create request straight from the validated struct
+        new_request = Request(**msgspec.structs.asdict(data))
+        
+        # Flush for the ID; the decision commit persists both rows together
         db.session.add(new_request)
-        db.session.commit()
+        db.session.flush()
         logger.info(f"Created request ID={new_request.id}")
         
         # Evaluate and create decision
@@ -62,36 +69,100 @@ def submit_request():
             'decision': decision_schema.dump(decision)
         }), 201
 
-    except ValidationError as err:
-        return jsonify({'error': 'Validation failed', 'details': err.messages}), 400
+    except msgspec.ValidationError as err:
+        return jsonify({'error': 'Validation failed', 'details': str(err)}), 400
+    
+    except msgspec.DecodeError as err:
+        return jsonify({'error': 'Invalid JSON', 'details': str(err)}), 400
     
-    except Exception as e:
+    except Exception:
         db.session.rollback()
-        return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
+        logger.exception("Error submitting request")
+        return internal_error()
+
+@request_bp.route('/preview', methods=['POST'])
+def preview_request():
+    """
+    Evaluate a request against the current rules without saving anything.
+    
+    Request body: same as submit_request
+    
+    Returns:
+        {
+            "decision": string,
+            "explanation": string,
+            "rule_id": int | null
+        }
+    """
+    try:
+        data = msgspec.json.decode(request.get_data(), type=RequestIn)
+        
+        # Never added to the session, so nothing is written
+        decision = DecisionService.evaluate(Request(**msgspec.structs.asdict(data)))
+        
+        return jsonify({
+            'decision': decision.decision,
+            'explanation': decision.explanation,
+            'rule_id': decision.rule_id
+        }), 200
+    
+    except msgspec.ValidationError as err:
+        return jsonify({'error': 'Validation failed', 'details': str(err)}), 400
+    
+    except msgspec.DecodeError as err:
+        return jsonify({'error': 'Invalid JSON', 'details': str(err)}), 400
+    
+    except Exception:
+        logger.exception("Error previewing request")
+        return internal_error()
 
 @request_bp.route('', methods=['GET'])
 def list_requests():
     """
-    List all requests.
+    List requests, newest first, one page at a time.
+    
+    Query parameters:
+        limit: int (optional, default 50, max 200)
+        cursor: string (optional, next_cursor from the previous page)
     
     Returns:
-        [
-            {
-                "id": int,
-                "amount": float,
-                "category": string,
-                "description": string,
-                "created_at": datetime
-            },
-            ...
-        ]
+        {
+            "items": [
+                {
+                    "id": int,
+                    "amount": float,
+                    "category": string,
+                    "description": string,
+                    "created_at": datetime
+                },
+                ...
+            ],
+            "next_cursor": string | null
+        }
     """
     try:
-        requests = Request.query.order_by(Request.created_at.desc()).all()
-        return jsonify(request_schema.dump(requests, many=True)), 200
+        limit, cursor = parse_page_args()
+        if cursor:
+            cursor = (datetime.fromisoformat(cursor[0]), int(cursor[1]))
+    except (ValueError, TypeError) as err:
+        return jsonify({'error': 'Invalid pagination parameters', 'details': str(err)}), 400
+    
+    try:
+        query = Request.query
+        if cursor:
+            query = query.filter(tuple_(Request.created_at, Request.id) < cursor)
+        
+        requests = query.order_by(Request.created_at.desc(), Request.id.desc()).limit(limit + 1).all()
+        
+        return jsonify(page_response(
+            requests, limit,
+            lambda rows: request_schema.dump(rows, many=True),
+            lambda row: [row.created_at.isoformat(), row.id]
+        )), 200
     
-    except Exception as e:
-        return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
+    except Exception:
+        logger.exception("Error listing requests")
+        return internal_error()
 
 @request_bp.route('/<int:request_id>', methods=['GET'])
 def get_request(request_id):
@@ -105,15 +176,24 @@ def get_request(request_id):
         }
     """
     try:
-        req = Request.query.get_or_404(request_id)
+        # Load the request and its decisions in one go; any other lazy load raises
+        req = db.session.execute(
+            select(Request)
+            .options(selectinload(Request.decisions), raiseload('*'))
+            .where(Request.id == request_id)
+        ).scalar_one_or_none()
+        
+        if req is None:
+            return jsonify({'error': 'Request not found'}), 404
         
-        # Get the most recent decision for this request
-        decision = Decision.query.filter_by(request_id=request_id).order_by(Decision.created_at.desc()).first()
+        # Most recent decision, picked from the already-loaded collection
+        decision = max(req.decisions, key=lambda d: d.created_at, default=None)
         
         return jsonify({
             'request': request_schema.dump(req),
             'decision': decision_schema.dump(decision) if decision else None
         }), 200
     
-    except Exception as e:
-        return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
+    except Exception:
+        logger.exception(f"Error retrieving request ID={request_id}")
+        return internal_error()
@@ -0,0 +1,21 @@
+"""
+Pre-encoded JSON responses for constant payloads.
+
+The body bytes are built once at import; each call wraps them in a fresh
+Response, since after_request hooks add per-request headers.
+"""
+from flask import Response
+
+def constant_json(body, status):
+    """
+    Return a factory for a fixed JSON response.
+
+    Args:
+        body: Pre-encoded JSON bytes
+        status: HTTP status code
+    """
+    def make_response():
+        return Response(body, status=status, mimetype='application/json')
+    return make_response
+
+internal_error = constant_json(b'{"error":"Internal server error"}', 500)
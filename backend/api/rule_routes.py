@@ -2,16 +2,43 @@
 Rule API routes.
 """
 import logging
+import msgspec
 from flask import Blueprint, request, jsonify, g
-from marshmallow import ValidationError
+from sqlalchemy import tuple_
 from models.rule import Rule
 from schemas.rule_schema import rule_schema
+from schemas.structs import RuleIn
 from database import db
+from api.pagination import parse_page_args, page_response
+from api.responses import constant_json, internal_error
+from services import rule_cache
 
 logger = logging.getLogger(__name__)
 
 rule_bp = Blueprint('rules', __name__, url_prefix='/api/rules')
 
+rule_deleted = constant_json(b'{"message":"Rule deleted successfully"}', 200)
+
+# Serialized rules keyed by their full row contents, so a row changed by
+# another worker (or a reused SQLite id) is a miss, not stale output. The
+# cache is also cleared whenever the rule cache sees the rule set change.
+_dump_cache = {}
+rule_cache.on_change(_dump_cache.clear)
+
+def _dump_key(rule):
+    return (rule.id, rule.field, rule.operator, rule.value, rule.decision, rule.priority)
+
+def _dump_rules(rules):
+    """Serialize rules, reusing cached output for unchanged rows."""
+    dumped = []
+    for r in rules:
+        key = _dump_key(r)
+        payload = _dump_cache.get(key)
+        if payload is None:
+            payload = _dump_cache[key] = rule_schema.dump(r)
+        dumped.append(payload)
+    return dumped
+
 @rule_bp.route('', methods=['POST'])
 def create_rule():
     """
@@ -37,58 +64,82 @@ def create_rule():
         }
     """
     try:
-        # Validate input
-        data = rule_schema.load(request.json)
-        logger.info(f"Creating rule: field={data['field']}, operator={data['operator']}, priority={data['priority']}")
+        # Decode and validate input in one pass
+        data = msgspec.json.decode(request.get_data(), type=RuleIn)
+        logger.info(f"Creating rule: field={data.field}, operator={data.operator}, priority={data.priority}")
         
-        # Create rule
-        new_rule = Rule(
-            field=data['field'],
-            operator=data['operator'],
-            value=data['value'],
-            decision=data['decision'],
-            priority=data['priority']
-        )
+        # Create rule straight from the validated struct
+        new_rule = Rule(**msgspec.structs.asdict(data))
         
         db.session.add(new_rule)
         db.session.commit()
         logger.info(f"Created rule ID={new_rule.id}")
         
-        return jsonify(rule_schema.dump(new_rule)), 201
+        payload = _dump_cache[_dump_key(new_rule)] = rule_schema.dump(new_rule)
+        return jsonify(payload), 201
     
-    except ValidationError as err:
-        return jsonify({'error': 'Validation failed', 'details': err.messages}), 400
+    except msgspec.ValidationError as err:
+        return jsonify({'error': 'Validation failed', 'details': str(err)}), 400
     
-    except Exception as e:
+    except msgspec.DecodeError as err:
+        return jsonify({'error': 'Invalid JSON', 'details': str(err)}), 400
+    
+    except Exception:
         db.session.rollback()
-        return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
+        logger.exception("Error creating rule")
+        return internal_error()
 
 @rule_bp.route('', methods=['GET'])
 def list_rules():
     """
-    List all rules ordered by priority.
+    List rules ordered by priority, one page at a time.
+    
+    Query parameters:
+        limit: int (optional, default 50, max 200)
+        cursor: string (optional, next_cursor from the previous page)
     
     Returns:
-        [
-            {
-                "id": int,
-                "field": string,
-                "operator": string,
-                "value": string,
-                "decision": string,
-                "priority": int
-            },
-            ...
-        ]
+        {
+            "items": [
+                {
+                    "id": int,
+                    "field": string,
+                    "operator": string,
+                    "value": string,
+                    "decision": string,
+                    "priority": int
+                },
+                ...
+            ],
+            "next_cursor": string | null
+        }
     """
     try:
-        logger.info("Listing all rules")
-        rules = Rule.query.order_by(Rule.priority.asc()).all()
-        logger.info(f"Found {len(rules)} rules")
-        return jsonify(rule_schema.dump(rules, many=True)), 200
+        limit, cursor = parse_page_args()
+        if cursor:
+            cursor = (int(cursor[0]), int(cursor[1]))
+    except (ValueError, TypeError) as err:
+        return jsonify({'error': 'Invalid pagination parameters', 'details': str(err)}), 400
+    
+    try:
+        logger.debug("Listing rules")
+        query = Rule.query
+        if cursor:
+            query = query.filter(tuple_(Rule.priority, Rule.id) > cursor)
+        
+        rules = query.order_by(Rule.priority.asc(), Rule.id.asc()).limit(limit + 1).all()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Found {len(rules)} rules")
+        
+        return jsonify(page_response(
+            rules, limit,
+            _dump_rules,
+            lambda row: [row.priority, row.id]
+        )), 200
     
-    except Exception as e:
-        return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
+    except Exception:
+        logger.exception("Error listing rules")
+        return internal_error()
 
 @rule_bp.route('/<int:rule_id>', methods=['DELETE'])
 def delete_rule(rule_id):
@@ -102,14 +153,18 @@ def delete_rule(rule_id):
     """
     try:
         logger.info(f"Deleting rule ID={rule_id}")
-        rule = Rule.query.get_or_404(rule_id)
+        rule = db.session.get(Rule, rule_id)
+        
+        if rule is None:
+            return jsonify({'error': 'Rule not found'}), 404
         
         db.session.delete(rule)
         db.session.commit()
         logger.info(f"Successfully deleted rule ID={rule_id}")
         
-        return jsonify({'message': 'Rule deleted successfully'}), 200
+        return rule_deleted()
     
-    except Exception as e:
+    except Exception:
         db.session.rollback()
-        return jsonify({'error': 'Internal server error', 'details': str(e)}), 500
+        logger.exception(f"Error deleting rule ID={rule_id}")
+        return internal_error()
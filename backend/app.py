@@ -7,21 +7,30 @@ import logging
 import time
 from flask import Flask, g, request
 from flask_cors import CORS
+from sqlalchemy import insert, select
 from config import Config
 from database import db, init_db
 from api import request_bp, rule_bp
 from api.metrics_routes import metrics_bp
 from models import Rule
 from logging_config import setup_logging
+from json_provider import OrjsonProvider
+from routing import CachedMap
 from middleware import setup_request_id_middleware
 from metrics import metrics_collector
 
 logger = logging.getLogger(__name__)
 
+class RuleGuardFlask(Flask):
+    """Flask application with cached matching for static routes."""
+    
+    url_map_class = CachedMap
+
 def create_app(config_class=Config):
     """Create and configure Flask application."""
-    app = Flask(__name__)
+    app = RuleGuardFlask(__name__)
     app.config.from_object(config_class)
+    app.json = OrjsonProvider(app)
     
     # Initialize logging
     setup_logging(app)
@@ -71,8 +80,9 @@ def setup_metrics_tracking(app):
             duration_ms = (time.time() - g.start_time) * 1000
             metrics_collector.record_response_time(duration_ms)
         
-        # Record request
-        metrics_collector.record_request(request.method, request.path)
+        # Record request by route pattern so per-ID paths share one counter
+        endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        metrics_collector.record_request(request.method, endpoint)
         
         # Record errors
         if response.status_code >= 400:
@@ -82,38 +92,21 @@ def setup_metrics_tracking(app):
 
 def seed_data():
     """Create initial seed data if database is empty."""
-    # Check if rules already exist
-    if Rule.query.count() > 0:
+    # Check if any rule exists (stops at the first row instead of counting)
+    if db.session.scalar(select(Rule.id).limit(1)) is not None:
         logger.info("Database already contains rules, skipping seed data")
         return
     
     logger.info("Creating seed data...")
     
     sample_rules = [
-        Rule(
-            field='amount',
-            operator='>',
-            value='5000',
-            decision='REVIEW',
-            priority=1
-        ),
-        Rule(
-            field='amount',
-            operator='>',
-            value='1000',
-            decision='APPROVE',
-            priority=2
-        ),
-        Rule(
-            field='category',
-            operator='==',
-            value='restricted',
-            decision='REJECT',
-            priority=3
-        ),
+        {'field': 'amount', 'operator': '>', 'value': '5000', 'decision': 'REVIEW', 'priority': 1},
+        {'field': 'amount', 'operator': '>', 'value': '1000', 'decision': 'APPROVE', 'priority': 2},
+        {'field': 'category', 'operator': '==', 'value': 'restricted', 'decision': 'REJECT', 'priority': 3},
     ]
     
-    db.session.add_all(sample_rules)
+    # One executemany INSERT instead of per-object ORM flushes
+    db.session.execute(insert(Rule), sample_rules)
     db.session.commit()
     logger.info(f"Created {len(sample_rules)} sample rules")
 
@@ -0,0 +1,15 @@
+"""
+ASGI entry point for running RuleGuard under Uvicorn.
+
+The Flask app stays synchronous; a2wsgi runs each request on a bounded
+thread pool while Uvicorn's event loop owns the sockets, so idle and
+slow connections no longer pin a worker thread each.
+
+Run from the backend directory:
+    uvicorn asgi:app --workers 4
+"""
+from a2wsgi import WSGIMiddleware
+from app import create_app
+from config import Config
+
+app = WSGIMiddleware(create_app(), workers=Config.ASGI_WORKER_THREADS)
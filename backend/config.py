@@ -10,6 +10,7 @@ class Config:
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
     SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(BASE_DIR, 'ruleguard.db')}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {'pool_size': 10}
     
     # Flask
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
@@ -22,6 +23,9 @@ class Config:
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
     LOG_FILE = os.environ.get('LOG_FILE', 'logs/ruleguard.log')
     
+    # Threads per ASGI worker process serving the WSGI app (see asgi.py)
+    ASGI_WORKER_THREADS = int(os.environ.get('ASGI_WORKER_THREADS', '10'))
+    
     # Metrics configuration
     METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
 
@@ -16,12 +16,11 @@ from flask import g, has_request_context
 class RequestIdFilter(logging.Filter):
     """Add request ID to log records."""
     
-    def filter(self, record):
+    def filter(self, record, _has_request_context=has_request_context):
         """Add request_id attribute to log record."""
-        if has_request_context() and hasattr(g, 'request_id'):
-            record.request_id = g.request_id
-        else:
-            record.request_id = 'N/A'
+        # One shared instance sits on every handler; tag each record once
+        if 'request_id' not in record.__dict__:
+            record.request_id = g.get('request_id', 'N/A') if _has_request_context() else 'N/A'
         return True
 
 
@@ -41,9 +40,12 @@ def setup_logging(app):
     if log_dir and not os.path.exists(log_dir):
         os.makedirs(log_dir)
     
+    level = getattr(logging, log_level)
+    request_id_filter = RequestIdFilter()
+    
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level))
+    root_logger.setLevel(level)
     
     # Remove existing handlers
     root_logger.handlers = []
@@ -56,9 +58,9 @@ def setup_logging(app):
     
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level))
+    console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(RequestIdFilter())
+    console_handler.addFilter(request_id_filter)
     root_logger.addHandler(console_handler)
     
     # File handler with rotation
@@ -67,9 +69,9 @@ def setup_logging(app):
         maxBytes=10 * 1024 * 1024,  # 10MB
         backupCount=5
     )
-    file_handler.setLevel(getattr(logging, log_level))
+    file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    file_handler.addFilter(RequestIdFilter())
+    file_handler.addFilter(request_id_filter)
     root_logger.addHandler(file_handler)
     
     # Log startup
@@ -7,24 +7,42 @@ Tracks:
 - Response times
 - Error counts by type
 """
+import array
 import time
 import threading
-from collections import defaultdict
 from datetime import datetime
+import orjson
 
 
 class MetricsCollector:
     """Thread-safe metrics collector."""
     
-    def __init__(self):
-        """Initialize metrics collector."""
+    # Number of most recent response times kept for the average
+    RESPONSE_TIME_WINDOW = 1000
+    
+    def __init__(self, cache_ttl=0.5):
+        """
+        Initialize metrics collector.
+        
+        Args:
+            cache_ttl: Seconds a serialized metrics snapshot is reused
+        """
         self._lock = threading.Lock()
         self._start_time = time.time()
-        self._request_counts = defaultdict(int)  # (method, endpoint) -> count
-        self._decision_counts = defaultdict(int)  # decision -> count
-        self._error_counts = defaultdict(int)  # status_code -> count
-        self._response_times = []  # List of response times
+        self._request_counts = {}  # (method, endpoint) -> count
+        self._decision_counts = {}  # decision -> count
+        self._error_counts = {}  # status_code -> count
         self._total_requests = 0
+        
+        # Fixed-size ring buffer of response times with a running sum
+        self._rt_buf = array.array('d', [0.0] * self.RESPONSE_TIME_WINDOW)
+        self._rt_idx = 0
+        self._rt_count = 0
+        self._rt_sum = 0.0
+        
+        # (expiry, json_bytes) for the last serialized snapshot
+        self._cache_ttl = cache_ttl
+        self._json_cache = None
     
     def record_request(self, method, endpoint):
         """
@@ -32,10 +50,11 @@ class MetricsCollector:
         
         Args:
             method: HTTP method (GET, POST, etc.)
-            endpoint: API endpoint path
+            endpoint: API route pattern (e.g. /api/requests/<int:request_id>)
         """
+        key = (method, endpoint)
         with self._lock:
-            self._request_counts[(method, endpoint)] += 1
+            self._request_counts[key] = self._request_counts.get(key, 0) + 1
             self._total_requests += 1
     
     def record_decision(self, decision):
@@ -46,7 +65,7 @@ class MetricsCollector:
             decision: Decision string (APPROVED, REJECTED, NEEDS_REVIEW)
         """
         with self._lock:
-            self._decision_counts[decision] += 1
+            self._decision_counts[decision] = self._decision_counts.get(decision, 0) + 1
     
     def record_error(self, status_code):
         """
@@ -56,7 +75,7 @@ class MetricsCollector:
             status_code: HTTP status code (400, 500, etc.)
         """
         with self._lock:
-            self._error_counts[status_code] += 1
+            self._error_counts[status_code] = self._error_counts.get(status_code, 0) + 1
     
     def record_response_time(self, duration_ms):
         """
@@ -66,10 +85,20 @@ class MetricsCollector:
             duration_ms: Response time in milliseconds
         """
         with self._lock:
-            self._response_times.append(duration_ms)
-            # Keep only last 1000 response times to prevent memory growth
-            if len(self._response_times) > 1000:
-                self._response_times = self._response_times[-1000:]
+            # Overwrite the oldest slot and adjust the running sum
+            idx = self._rt_idx
+            self._rt_sum += duration_ms - self._rt_buf[idx]
+            self._rt_buf[idx] = duration_ms
+            
+            idx += 1
+            if idx == self.RESPONSE_TIME_WINDOW:
+                idx = 0
+                # Resync once per lap so float error can't accumulate
+                self._rt_sum = sum(self._rt_buf)
+            self._rt_idx = idx
+            
+            if self._rt_count < self.RESPONSE_TIME_WINDOW:
+                self._rt_count += 1
     
     def get_metrics(self):
         """
@@ -83,29 +112,46 @@ class MetricsCollector:
             uptime_seconds = int(time.time() - self._start_time)
             
             # Calculate average response time
-            avg_response_time = 0
-            if self._response_times:
-                avg_response_time = sum(self._response_times) / len(self._response_times)
+            avg_response_time = self._rt_sum / self._rt_count if self._rt_count else 0
             
             # Format request counts by endpoint
-            requests_by_endpoint = {}
-            for (method, endpoint), count in self._request_counts.items():
-                key = f"{method} {endpoint}"
-                requests_by_endpoint[key] = count
+            requests_by_endpoint = {
+                f"{method} {endpoint}": count
+                for (method, endpoint), count in self._request_counts.items()
+            }
             
             return {
                 'uptime_seconds': uptime_seconds,
                 'total_requests': self._total_requests,
-                'requests_by_endpoint': dict(requests_by_endpoint),
+                'requests_by_endpoint': requests_by_endpoint,
                 'decisions': dict(self._decision_counts),
                 'errors': dict(self._error_counts),
                 'response_time_ms': {
                     'average': round(avg_response_time, 2),
-                    'samples': len(self._response_times)
+                    'samples': self._rt_count
                 },
                 'timestamp': datetime.utcnow().isoformat()
             }
     
+    def get_metrics_json(self):
+        """
+        Get the current metrics snapshot as JSON bytes.
+        
+        The encoded snapshot is reused for cache_ttl seconds, so frequent
+        scrapes skip the lock, the dict build and the encoding.
+        
+        Returns:
+            bytes: JSON-encoded metrics
+        """
+        now = time.monotonic()
+        cached = self._json_cache
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        
+        payload = orjson.dumps(self.get_metrics(), option=orjson.OPT_NON_STR_KEYS)
+        self._json_cache = (now + self._cache_ttl, payload)
+        return payload
+    
     def reset(self):
         """Reset all metrics (useful for testing)."""
         with self._lock:
@@ -113,8 +159,12 @@ class MetricsCollector:
             self._request_counts.clear()
             self._decision_counts.clear()
             self._error_counts.clear()
-            self._response_times.clear()
+            self._rt_buf = array.array('d', [0.0] * self.RESPONSE_TIME_WINDOW)
+            self._rt_idx = 0
+            self._rt_count = 0
+            self._rt_sum = 0.0
             self._total_requests = 0
+            self._json_cache = None
 
 
 # Global metrics collector instance
@@ -6,12 +6,28 @@ Generates unique request ID for each request and adds to:
 - Response headers (X-Request-ID)
 - Log messages (via RequestIdFilter)
 """
-import uuid
+import base64
 import logging
+import os
+import random
 from flask import g, request
 
 logger = logging.getLogger(__name__)
 
+# Tracing IDs only need to be unique, not unpredictable, so draw them from a
+# PRNG seeded once from the OS instead of reading /dev/urandom per request.
+_rng = random.Random(os.urandom(16))
+
+def _reseed():
+    """Give each forked worker its own sequence."""
+    _rng.seed(os.urandom(16))
+
+os.register_at_fork(after_in_child=_reseed)
+
+def new_request_id():
+    """Return a 16-character URL-safe ID carrying 96 random bits."""
+    return base64.urlsafe_b64encode(_rng.getrandbits(96).to_bytes(12, 'big')).decode()
+
 
 def setup_request_id_middleware(app):
     """
@@ -29,16 +45,17 @@ def setup_request_id_middleware(app):
         
         # Generate new ID if not provided
         if not request_id:
-            request_id = str(uuid.uuid4())
+            request_id = new_request_id()
         
         # Store in Flask g object
         g.request_id = request_id
         
-        # Log incoming request
-        logger.info(
-            f"Incoming request: {request.method} {request.path} "
-            f"from {request.remote_addr}"
-        )
+        # Log incoming request (debug only; skip formatting when filtered out)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Incoming request: {request.method} {request.path} "
+                f"from {request.remote_addr}"
+            )
     
     @app.after_request
     def add_request_id_header(response):
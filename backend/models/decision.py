@@ -16,6 +16,13 @@ class Decision(db.Model):
     rule_id = db.Column(db.Integer, db.ForeignKey('rules.id'), nullable=True)  # Null if no rule matched
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     
+    # Serves "latest decision for a request" lookups, and the decisions
+    # scan that un-links a rule's decisions when the rule is deleted
+    __table_args__ = (
+        db.Index('ix_decisions_request_created', request_id, created_at.desc()),
+        db.Index('ix_decisions_rule_id', rule_id),
+    )
+    
     def __repr__(self):
         return f'<Decision {self.id}: Request {self.request_id} → {self.decision}>'
     
@@ -18,6 +18,11 @@ class Request(db.Model):
     # Relationship to decisions
     decisions = db.relationship('Decision', backref='request', lazy=True, cascade='all, delete-orphan')
     
+    # Serves the newest-first keyset pagination in list_requests
+    __table_args__ = (
+        db.Index('ix_requests_created_id', created_at.desc(), id.desc()),
+    )
+    
     def __repr__(self):
         return f'<Request {self.id}: {self.category} ${self.amount}>'
     
@@ -18,6 +18,13 @@ class Rule(db.Model):
     # Relationship to decisions
     decisions = db.relationship('Decision', backref='rule', lazy=True)
     
+    # Serve priority-ordered listing and keyset pagination, and
+    # priority-ordered scans restricted to one field
+    __table_args__ = (
+        db.Index('ix_rules_priority_id', 'priority', 'id'),
+        db.Index('ix_rules_field_priority', 'field', 'priority'),
+    )
+    
     def __repr__(self):
         return f'<Rule {self.id}: {self.field} {self.operator} {self.value} → {self.decision} (priority={self.priority})>'
     
@@ -0,0 +1,93 @@
+"""
+URL map with a cache for static routes.
+
+Most traffic hits a handful of fixed paths (/api/requests, /api/rules,
+/api/metrics). Their match result depends only on host, path and method,
+so it is looked up in a dict instead of walking the matcher on every
+request. The host is only part of the key when the map matches on hosts,
+since otherwise it is just the client-supplied Host header. Routes with converters such as /<int:request_id> go through
+normal matching.
+"""
+from collections import OrderedDict
+from werkzeug.routing import Map, MapAdapter
+
+
+class CachedMap(Map):
+    """Map that remembers which rule each static (host, path, method) hits."""
+
+    # Upper bound on cached entries; least recently used ones are evicted
+    MAX_CACHED_ROUTES = 1024
+
+    def __init__(self, *args, **kwargs):
+        # Set first: Map.__init__ calls add() for any rules passed in
+        self.static_match_cache = OrderedDict()
+        self.uses_subdomains = False
+        super().__init__(*args, **kwargs)
+
+    def add(self, rulefactory):
+        """Add a rule and drop cached matches it could shadow."""
+        super().add(rulefactory)
+        # Subdomain only matters to matching once some rule is bound to one
+        self.uses_subdomains = any(rule.subdomain for rule in self.iter_rules())
+        self.static_match_cache.clear()
+
+    def bind(self, *args, **kwargs):
+        """Bind to a host and return a caching adapter."""
+        return self._caching_adapter(super().bind(*args, **kwargs))
+
+    def bind_to_environ(self, *args, **kwargs):
+        """Bind to a WSGI environ and return a caching adapter."""
+        # Map.bind_to_environ calls Map.bind directly, not self.bind
+        return self._caching_adapter(super().bind_to_environ(*args, **kwargs))
+
+    def _caching_adapter(self, adapter):
+        """Rebuild a bound MapAdapter as a CachedMapAdapter."""
+        return CachedMapAdapter(
+            self,
+            adapter.server_name,
+            adapter.script_name,
+            adapter.subdomain,
+            adapter.url_scheme,
+            adapter.path_info,
+            adapter.default_method,
+            adapter.query_args,
+        )
+
+
+class CachedMapAdapter(MapAdapter):
+    """Adapter that serves static route matches from the map's cache."""
+
+    def match(self, path_info=None, method=None, return_rule=False, query_args=None, websocket=None):
+        """Match like MapAdapter.match, consulting the static route cache first."""
+        if path_info is None:
+            path_info = self.path_info
+        method = (method or self.default_method).upper()
+        if websocket is None:
+            websocket = self.websocket
+
+        cache = self.map.static_match_cache
+        if self.map.host_matching:
+            key = (self.server_name, path_info, method, websocket)
+        elif self.map.uses_subdomains:
+            key = (self.subdomain, path_info, method, websocket)
+        else:
+            key = (path_info, method, websocket)
+        rule = cache.get(key)
+
+        if rule is None:
+            rule, view_args = super().match(path_info, method, True, query_args, websocket)
+
+            # Only rules whose match carries no values are safe to replay
+            if rule.arguments or rule.defaults or rule.redirect_to is not None:
+                return (rule if return_rule else rule.endpoint), view_args
+
+            cache[key] = rule
+            if len(cache) > self.map.MAX_CACHED_ROUTES:
+                cache.popitem(last=False)
+        else:
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                pass  # Evicted or cleared by another thread
+
+        return (rule if return_rule else rule.endpoint), {}
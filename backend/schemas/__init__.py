@@ -2,9 +2,11 @@
 from .request_schema import RequestSchema, request_schema
 from .rule_schema import RuleSchema, rule_schema
 from .decision_schema import DecisionSchema, decision_schema
+from .structs import RequestIn, RuleIn
 
 __all__ = [
     'RequestSchema', 'request_schema',
     'RuleSchema', 'rule_schema',
-    'DecisionSchema', 'decision_schema'
+    'DecisionSchema', 'decision_schema',
+    'RequestIn', 'RuleIn'
 ]
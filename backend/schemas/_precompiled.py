@@ -0,0 +1,77 @@
+"""
+Precompiled dump functions for Marshmallow schemas.
+
+Schema.dump walks every field generically on each call. For the flat
+schemas in this package the output only depends on which attribute each
+key reads and how its value is converted, so that plan is worked out once
+at import time and dump becomes a single dict comprehension.
+
+No code is generated or exec'd; the plan is a tuple of
+(key, attrgetter, converter) entries.
+"""
+from operator import attrgetter
+from marshmallow import fields
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
+
+# Exact field types whose dump is "convert unless None"
+_SIMPLE_CONVERTERS = {
+    fields.Integer: int,
+    fields.Float: float,
+    fields.String: str,
+}
+
+def _none_safe(convert):
+    return lambda value: None if value is None else convert(value)
+
+def _converter(field):
+    """Return the value converter for a bound field, or None if unsupported."""
+    field_type = type(field)
+
+    if field_type in _SIMPLE_CONVERTERS:
+        if getattr(field, 'as_string', False):
+            return None
+        return _none_safe(_SIMPLE_CONVERTERS[field_type])
+
+    if field_type is fields.DateTime:
+        format_func = field.SERIALIZATION_FUNCS.get(field.format)
+        if format_func is None:
+            return _none_safe(lambda value, fmt=field.format: value.strftime(fmt))
+        return _none_safe(format_func)
+
+    return None
+
+def precompile_dump(schema):
+    """
+    Replace schema.dump with a precompiled equivalent.
+
+    Schemas with dump hooks or field types without a known converter are
+    left untouched. Dumped objects must expose every field as an attribute.
+
+    Args:
+        schema: Schema instance to patch
+
+    Returns:
+        The same schema instance
+    """
+    if schema._has_processors(PRE_DUMP) or schema._has_processors(POST_DUMP):
+        return schema
+
+    plan = []
+    for name, field in schema.dump_fields.items():
+        convert = _converter(field)
+        if convert is None:
+            return schema
+        plan.append((field.data_key or name, attrgetter(field.attribute or name), convert))
+    plan = tuple(plan)
+
+    def dump_one(obj):
+        return {key: convert(get(obj)) for key, get, convert in plan}
+
+    def dump(obj, *, many=None):
+        many = schema.many if many is None else bool(many)
+        if many:
+            return [dump_one(item) for item in obj]
+        return dump_one(obj)
+
+    schema.dump = dump
+    return schema
@@ -2,6 +2,7 @@
 Decision schema for serialization.
 """
 from marshmallow import Schema, fields
+from ._precompiled import precompile_dump
 
 class DecisionSchema(Schema):
     """Schema for serializing decision output."""
@@ -14,4 +15,4 @@ class DecisionSchema(Schema):
     created_at = fields.DateTime(dump_only=True)
 
 # Create singleton instance for reuse
-decision_schema = DecisionSchema()
+decision_schema = precompile_dump(DecisionSchema())
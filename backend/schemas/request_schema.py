@@ -1,28 +1,19 @@
 """
-Request validation schema using Marshmallow.
+Request serialization schema using Marshmallow.
+
+Output only: input is decoded and validated by RequestIn in structs.py.
 """
-from marshmallow import Schema, fields, validates, ValidationError
+from marshmallow import Schema, fields
+from ._precompiled import precompile_dump
 
 class RequestSchema(Schema):
-    """Schema for validating request input."""
+    """Schema for serializing requests."""
     
-    id = fields.Int(dump_only=True)
-    amount = fields.Float(required=True)
-    category = fields.Str(required=True)
+    id = fields.Int()
+    amount = fields.Float()
+    category = fields.Str()
     description = fields.Str(allow_none=True)
-    created_at = fields.DateTime(dump_only=True)
-    
-    @validates('amount')
-    def validate_amount(self, value):
-        """Ensure amount is greater than 0."""
-        if value <= 0:
-            raise ValidationError('Amount must be greater than 0')
-    
-    @validates('category')
-    def validate_category(self, value):
-        """Ensure category is not empty."""
-        if not value or not value.strip():
-            raise ValidationError('Category cannot be empty')
+    created_at = fields.DateTime()
 
 # Create singleton instance for reuse
-request_schema = RequestSchema()
+request_schema = precompile_dump(RequestSchema())
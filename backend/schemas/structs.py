@@ -0,0 +1,38 @@
+"""
+Typed input structs decoded and validated with msgspec.
+
+These replace Marshmallow on the JSON-in path: msgspec decodes the raw
+request body straight into a typed struct and enforces the constraints
+in C, so handlers never build an intermediate dict.
+
+Validation happens exactly once, here. Struct fields mirror the model
+columns so handlers can build models with Model(**asdict(struct)); the
+models themselves do no validation.
+"""
+import sys
+from typing import Annotated, Literal, Optional
+import msgspec
+
+# Non-empty and not just whitespace
+NonBlankStr = Annotated[str, msgspec.Meta(min_length=1, pattern=r'\S')]
+
+class RequestIn(msgspec.Struct, forbid_unknown_fields=True):
+    """Request submission body."""
+
+    amount: Annotated[float, msgspec.Meta(gt=0)]
+    category: NonBlankStr
+    description: Optional[str] = None
+
+    def __post_init__(self):
+        # Categories repeat across requests and match interned rule values,
+        # so equality checks and dict lookups hit the identity fast path
+        self.category = sys.intern(self.category)
+
+class RuleIn(msgspec.Struct, forbid_unknown_fields=True):
+    """Rule creation body."""
+
+    field: Literal['amount', 'category']
+    operator: Literal['<', '<=', '>', '==']
+    value: str
+    decision: Literal['APPROVE', 'REJECT', 'REVIEW']
+    priority: Annotated[int, msgspec.Meta(ge=0)]
@@ -2,20 +2,72 @@
 Decision Service - Orchestrates request evaluation and decision creation.
 """
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from models.request import Request
-from models.rule import Rule
 from models.decision import Decision
 from database import db
-from services.rule_engine import RuleEngine
+from services import rule_cache
+from services.rule_engine import RequestView
+from services.rule_cache import CachedRule
 
 logger = logging.getLogger(__name__)
 
+# Explanation when no rule matches: (category, amount)
+NO_MATCH_TEMPLATE = (
+    "No matching rule found for this request. "
+    "Category: '%s', Amount: $%.2f. "
+    "Manual review required."
+)
+
 class DecisionService:
     """
     Service for creating decisions based on request evaluation.
     """
     
+    @staticmethod
+    def evaluate(request: Request) -> Decision:
+        """
+        Evaluate a request without saving anything.
+        
+        For previews and dry runs; the request need not be saved either.
+        
+        Args:
+            request: Request object to evaluate
+        
+        Returns:
+            Unsaved Decision object with outcome and explanation
+        """
+        return DecisionService.evaluate_many([request])[0]
+    
+    @staticmethod
+    def evaluate_many(requests: List[Request]) -> List[Decision]:
+        """
+        Evaluate several requests without saving anything.
+        
+        Rules are fetched once for the whole batch.
+        
+        Args:
+            requests: Request objects to evaluate
+        
+        Returns:
+            Unsaved Decision objects, in the same order as requests
+        """
+        # Get all rules sorted by priority, precompiled (cached between rule changes)
+        compiled_rules = rule_cache.get_compiled()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Evaluating {len(requests)} requests against {len(compiled_rules)} rules")
+        
+        # Prepare request data for evaluation
+        rows = [RequestView(request.amount, request.category) for request in requests]
+        
+        # Find matching rules for the whole batch
+        matching_rules = compiled_rules.match_many(rows)
+        
+        return [
+            DecisionService._decide(request, matching_rule)
+            for request, matching_rule in zip(requests, matching_rules)
+        ]
+    
     @staticmethod
     def evaluate_and_decide(request: Request) -> Decision:
         """
@@ -27,34 +79,49 @@ class DecisionService:
         Returns:
             Decision object with outcome and explanation
         """
-        # Get all rules from database, sorted by priority
-        rules = Rule.query.order_by(Rule.priority.asc()).all()
-        logger.info(f"Evaluating request ID={request.id} against {len(rules)} rules")
-        
-        # Prepare request data for evaluation
-        request_data = {
-            'amount': request.amount,
-            'category': request.category
-        }
+        return DecisionService.evaluate_and_decide_many([request])[0]
+    
+    @staticmethod
+    def evaluate_and_decide_many(requests: List[Request]) -> List[Decision]:
+        """
+        Evaluate several requests and create their decisions in one commit.
         
-        # Find matching rule
-        matching_rule = RuleEngine.evaluate_request(request_data, rules)
-        logger.info(f"Matching rule for request ID={request.id}: {matching_rule.id if matching_rule else 'None'}")
+        Args:
+            requests: Request objects to evaluate (must already have IDs)
         
-        # Create decision based on result
-        if matching_rule:
-            decision = DecisionService._create_decision_from_rule(request, matching_rule)
-        else:
-            decision = DecisionService._create_needs_review_decision(request)
+        Returns:
+            Decision objects, in the same order as requests
+        """
+        decisions = DecisionService.evaluate_many(requests)
         
-        # Save decision to database
-        db.session.add(decision)
+        # Save decisions to database
+        db.session.add_all(decisions)
         db.session.commit()
         
-        return decision
+        return decisions
+    
+    @staticmethod
+    def _decide(request: Request, matching_rule: Optional[CachedRule]) -> Decision:
+        """
+        Build the decision for a request from its matching rule.
+        
+        Args:
+            request: Request being evaluated
+            matching_rule: First matching rule, or None
+        
+        Returns:
+            Unsaved Decision object
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Matching rule for request ID={request.id}: {matching_rule.id if matching_rule else 'None'}")
+        
+        # Create decision based on result
+        if matching_rule:
+            return DecisionService._create_decision_from_rule(request, matching_rule)
+        return DecisionService._create_needs_review_decision(request)
     
     @staticmethod
-    def _create_decision_from_rule(request: Request, rule: Rule) -> Decision:
+    def _create_decision_from_rule(request: Request, rule: CachedRule) -> Decision:
         """
         Create a decision based on a matching rule.
         
@@ -65,20 +132,10 @@ class DecisionService:
         Returns:
             Decision object
         """
-        # Map rule decision to final decision format
-        decision_map = {
-            'APPROVE': 'APPROVED',
-            'REJECT': 'REJECTED',
-            'REVIEW': 'NEEDS_REVIEW'
-        }
-        
-        decision = decision_map.get(rule.decision, 'NEEDS_REVIEW')
-        explanation = DecisionService._generate_explanation(request, rule, decision)
-        
         return Decision(
             request_id=request.id,
-            decision=decision,
-            explanation=explanation,
+            decision=rule.final_decision,
+            explanation=DecisionService._generate_explanation(request, rule),
             rule_id=rule.id
         )
     
@@ -93,49 +150,23 @@ class DecisionService:
         Returns:
             Decision object
         """
-        explanation = (
-            f"No matching rule found for this request. "
-            f"Category: '{request.category}', Amount: ${request.amount:.2f}. "
-            f"Manual review required."
-        )
-        
         return Decision(
             request_id=request.id,
             decision='NEEDS_REVIEW',
-            explanation=explanation,
+            explanation=NO_MATCH_TEMPLATE % (request.category, request.amount),
             rule_id=None
         )
     
     @staticmethod
-    def _generate_explanation(request: Request, rule: Rule, decision: str) -> str:
+    def _generate_explanation(request: Request, rule: CachedRule) -> str:
         """
         Generate a clear explanation for the decision.
         
         Args:
             request: Request being evaluated
-            rule: Matching rule
-            decision: Final decision
+            rule: Matching rule (explanation template precomputed)
         
         Returns:
             Human-readable explanation string
         """
-        # Format the rule condition
-        if rule.field == 'amount':
-            condition = f"amount {rule.operator} ${rule.value}"
-        else:
-            condition = f"{rule.field} {rule.operator} '{rule.value}'"
-        
-        # Create explanation
-        explanation = (
-            f"Request {decision.lower()} based on rule: {condition}. "
-            f"Your request has {rule.field}="
-        )
-        
-        if rule.field == 'amount':
-            explanation += f"${request.amount:.2f}"
-        else:
-            explanation += f"'{getattr(request, rule.field)}'"
-        
-        explanation += f", which matches this rule (priority {rule.priority})."
-        
-        return explanation
+        return rule.explanation_template % (rule.getter(request),)
@@ -0,0 +1,267 @@
+"""
+Rule Cache - Per-process cache of the priority-ordered rule list.
+
+Rules are read on every decision but change rarely, so the ordered list is
+loaded once, compiled into predicates, and reused until a transaction that
+wrote to the rules table ends. Entries are plain snapshots, detached from
+any Session, so they stay valid across requests and commits.
+
+Rules written through the ORM are patched into the cached list when their
+transaction commits, so a single create/update/delete doesn't refetch and
+recompile every rule. Bulk statements and rollbacks fall back to dropping
+the cache.
+
+Updates only reach the process that made the change, so entries also
+expire after MAX_AGE seconds to pick up writes from other workers.
+"""
+import bisect
+import threading
+import time
+from operator import attrgetter
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from database import db
+from models.rule import Rule
+from services.rule_engine import Predicate, RuleEngine, RuleIndex
+
+# Session.info key marking a transaction whose rule writes can't be replayed
+_RULES_CHANGED = 'rule_cache.rules_changed'
+# Session.info key for {rule id: CachedRule, or None if deleted} written by a transaction
+_PENDING = 'rule_cache.pending'
+
+# Rule decision -> final decision recorded on a match
+FINAL_DECISIONS = {
+    'APPROVE': 'APPROVED',
+    'REJECT': 'REJECTED',
+    'REVIEW': 'NEEDS_REVIEW'
+}
+
+class CachedRule(NamedTuple):
+    """
+    Read-only snapshot of a Rule row.
+
+    final_decision, condition, getter and explanation_template are derived
+    once here so building a decision doesn't re-derive them per request.
+    """
+    id: int
+    field: str
+    operator: str
+    value: str
+    decision: str
+    priority: int
+    final_decision: str  # e.g. 'APPROVED'
+    condition: str  # e.g. "amount > $1000" or "category == 'travel'"
+    getter: Callable[[Any], Any]  # Reads the rule's field off a Request
+    explanation_template: str  # %-template taking that field's value
+
+    @classmethod
+    def from_row(cls, row) -> 'CachedRule':
+        """Snapshot a Rule, or a row of its columns."""
+        final_decision = FINAL_DECISIONS.get(row.decision, 'NEEDS_REVIEW')
+
+        if row.field == 'amount':
+            condition = f"amount {row.operator} ${row.value}"
+            value_format = '$%.2f'
+        else:
+            condition = f"{row.field} {row.operator} '{row.value}'"
+            value_format = "'%s'"
+
+        # Everything but the request's value is known now; escape stray %s
+        # coming from the rule itself before splicing in the placeholder
+        explanation_template = (
+            f"Request {final_decision.lower()} based on rule: {condition}. "
+            f"Your request has {row.field}="
+        ).replace('%', '%%') + value_format + f", which matches this rule (priority {row.priority})."
+
+        return cls(
+            row.id, row.field, row.operator, row.value, row.decision, row.priority,
+            final_decision, condition, attrgetter(row.field), explanation_template,
+        )
+
+# Built once against the table, not the mapper: run on the session's
+# Connection it skips ORM execution (autoflush, do_orm_execute, identity
+# map) entirely. Ordered like _sort_key, streamed from ix_rules_priority_id.
+_rules_table = Rule.__table__
+_RULES_STMT = (
+    select(
+        _rules_table.c.id, _rules_table.c.field, _rules_table.c.operator,
+        _rules_table.c.value, _rules_table.c.decision, _rules_table.c.priority,
+    )
+    .order_by(_rules_table.c.priority.asc(), _rules_table.c.id.asc())
+)
+
+# Seconds before cached rules are reloaded even without a local change
+MAX_AGE = 5.0
+
+_lock = threading.RLock()
+_entries: List[Tuple[Predicate, CachedRule]] = []  # Sorted by _sort_key
+_rules: Optional[List[CachedRule]] = None
+_compiled: Optional[RuleIndex] = None
+_expires_at = 0.0
+_generation = 0  # Bumped on every invalidation
+_listeners = []  # Called whenever the cached rule set is dropped or reloaded
+
+def get_rules() -> List[CachedRule]:
+    """
+    Get all rules sorted by priority, loading them on first use.
+
+    Returns:
+        List of CachedRule snapshots (shared; do not mutate)
+    """
+    return _current()[0]
+
+def get_compiled() -> RuleIndex:
+    """
+    Get all rules compiled with RuleEngine.compile_rules.
+
+    Returns:
+        RuleIndex over the cached rules (shared; do not mutate)
+    """
+    return _current()[1]
+
+def _current():
+    """Return the cached (rules, compiled) pair, reloading if stale."""
+    rules, compiled = _rules, _compiled
+    if rules is not None and time.monotonic() < _expires_at:
+        return rules, compiled
+
+    with _lock:
+        if _rules is not None and time.monotonic() < _expires_at:
+            return _rules, _compiled
+        return _load()
+
+def version() -> int:
+    """
+    Get the rules version, bumped on every invalidation.
+
+    Derived caches can store it alongside their entries and treat a
+    different version as a miss.
+    """
+    return _generation
+
+def invalidate() -> None:
+    """Drop the cached rules so the next read reloads them."""
+    global _rules, _generation
+    with _lock:
+        _rules = None
+        _generation += 1
+    _notify()
+
+def on_change(callback) -> None:
+    """
+    Register a callback for when the cached rule set is dropped or reloaded.
+
+    Lets caches derived from rules (e.g. serialized rules) stay in step.
+    """
+    _listeners.append(callback)
+
+def _notify() -> None:
+    for callback in _listeners:
+        callback()
+
+def _sort_key(entry) -> Tuple[int, int]:
+    """Cache order: priority, then id (matches ix_rules_priority_id)."""
+    rule = entry[1]
+    return rule.priority, rule.id
+
+def _publish(entries) -> None:
+    """Swap in a new sorted entry list (caller holds _lock)."""
+    global _entries, _rules, _compiled
+    _entries = entries
+    _rules = [rule for _, rule in entries]
+    _compiled = RuleIndex(entries)
+
+def _apply(changes) -> None:
+    """
+    Patch committed rule writes into the cached list.
+
+    Only the changed rules are compiled. The list is copied rather than
+    edited in place because readers iterate it without the lock.
+
+    Args:
+        changes: {rule id: CachedRule, or None if deleted}
+    """
+    global _generation
+    with _lock:
+        _generation += 1
+        if _rules is not None:
+            entries = list(_entries)
+            for rule_id, rule in changes.items():
+                for index, (_, cached) in enumerate(entries):
+                    if cached.id == rule_id:
+                        del entries[index]
+                        break
+                if rule is not None:
+                    bisect.insort(entries, (RuleEngine.compile(rule), rule), key=_sort_key)
+            _publish(entries)
+    _notify()
+
+def _load():
+    """Load and compile rules and cache them (caller holds _lock)."""
+    global _expires_at
+    generation = _generation
+    loaded_at = time.monotonic()
+
+    rows = db.session.connection().execute(_RULES_STMT).all()
+    entries = [(RuleEngine.compile(rule), rule) for rule in map(CachedRule.from_row, rows)]
+
+    # Don't publish if an invalidation raced with the query
+    if generation != _generation:
+        return [rule for _, rule in entries], RuleIndex(entries)
+
+    _publish(entries)
+    _expires_at = loaded_at + MAX_AGE
+    _notify()
+    return _rules, _compiled
+
+def _record(target, rule: Optional[CachedRule]) -> None:
+    """Remember a flushed rule write until its transaction ends."""
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING, {})[target.id] = rule
+
+@event.listens_for(Rule, 'after_insert')
+@event.listens_for(Rule, 'after_update')
+def _record_upsert(mapper, connection, target):
+    _record(target, CachedRule.from_row(target))
+
+@event.listens_for(Rule, 'after_delete')
+def _record_delete(mapper, connection, target):
+    _record(target, None)
+
+@event.listens_for(Session, 'do_orm_execute')
+def _mark_bulk_changed(orm_execute_state):
+    """Catch bulk insert/update/delete statements against the rules table."""
+    if orm_execute_state.is_select:
+        return
+    if orm_execute_state.bind_mapper is Rule.__mapper__:
+        orm_execute_state.session.info[_RULES_CHANGED] = True
+
+@event.listens_for(Session, 'after_commit')
+def _commit(session):
+    """Apply the rule writes of a committed transaction."""
+    changes = session.info.pop(_PENDING, None)
+    if session.info.pop(_RULES_CHANGED, False):
+        invalidate()
+    elif changes:
+        _apply(changes)
+
+@event.listens_for(Session, 'after_rollback')
+def _rollback(session):
+    """Drop the cache if a rolled-back transaction had written rules."""
+    changed = session.info.pop(_RULES_CHANGED, False)
+    if not (session.info.pop(_PENDING, None) or changed):
+        return
+
+    if session.in_nested_transaction():
+        # A savepoint rolled back: recorded writes may be gone, so reload
+        # once the enclosing transaction ends instead of replaying them
+        session.info[_RULES_CHANGED] = True
+    else:
+        invalidate()
+
+@event.listens_for(Rule.__table__, 'after_create')
+def _table_created(target, connection, **kw):
+    """A freshly created rules table holds nothing we have cached."""
+    invalidate()
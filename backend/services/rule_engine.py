@@ -3,9 +3,234 @@ Rule Engine - Core business logic for evaluating rules.
 
 CRITICAL: No eval() or exec() - uses safe operator mapping.
 """
-from typing import Optional, Dict, Any
+import operator
+import sys
+from enum import IntEnum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from models.rule import Rule
 
+try:
+    import numpy as np
+except ImportError:  # Optional: only speeds up large batches
+    np = None
+
+class OpCode(IntEnum):
+    """Rule operators, numbered to index _OP_FUNCS."""
+    LT = 0
+    LE = 1
+    GT = 2
+    EQ = 3
+
+# Operator symbol as stored on rules -> OpCode
+OP_CODES = {
+    '<': OpCode.LT,
+    '<=': OpCode.LE,
+    '>': OpCode.GT,
+    '==': OpCode.EQ,
+}
+
+# Comparison per OpCode - NO EVAL OR EXEC. C builtins, so a compiled
+# predicate's comparison doesn't cost an extra Python frame.
+_OP_FUNCS = (operator.lt, operator.le, operator.gt, operator.eq)
+
+class RequestView:
+    """
+    The request fields rules can test, normalized once per request.
+    
+    amount is a float and category a str, or None when missing (or, for
+    amount, not numeric), so compiled predicates read attributes and
+    compare without converting anything.
+    """
+    
+    __slots__ = ('amount', 'category')
+    
+    def __init__(self, amount: Any = None, category: Any = None):
+        if amount is not None:
+            try:
+                amount = float(amount)
+            except (ValueError, TypeError):
+                amount = None
+        self.amount = amount
+        self.category = None if category is None else str(category)
+    
+    @classmethod
+    def from_dict(cls, request_data: Dict[str, Any]) -> 'RequestView':
+        """Build a view from a dictionary of request fields."""
+        return cls(request_data.get('amount'), request_data.get('category'))
+
+# Compiled rule check: takes a RequestView, returns whether the rule matches
+Predicate = Callable[[RequestView], bool]
+
+def _never_match(request: RequestView) -> bool:
+    """Predicate for rules that can never match (bad field, operator or value)."""
+    return False
+
+def _amount_columns(amount_rules: list) -> list:
+    """
+    Group amount rules by operator for vectorized comparison.
+    
+    Returns:
+        List of (ufunc, column indices, threshold row) per operator
+    """
+    ufuncs = (np.less, np.less_equal, np.greater, np.equal)  # Indexed by OpCode
+    groups = {}
+    for column, (_, _, rule) in enumerate(amount_rules):
+        groups.setdefault(OP_CODES[rule.operator], []).append((column, float(rule.value)))
+    
+    return [
+        (
+            ufuncs[op_code],
+            np.array([column for column, _ in entries], dtype=np.intp),
+            np.array([[threshold for _, threshold in entries]], dtype=np.float64),
+        )
+        for op_code, entries in groups.items()
+    ]
+
+class RuleIndex:
+    """
+    Compiled rules bucketed by field.
+    
+    Category equality rules are looked up by value instead of scanned; the
+    remaining rules keep per-field lists. Every entry carries its position
+    in the original priority order, so the first match across buckets is
+    the same rule a linear scan would have returned.
+    """
+    
+    __slots__ = ('amount_rules', 'category_eq', 'other_rules', 'size', '_amount_columns', 'match_cached')
+    
+    # Below this many (request, amount rule) pairs, match_many stays scalar
+    VECTORIZE_MIN_PAIRS = 4096
+    
+    # Distinct (category, amount) results remembered per index
+    MATCH_CACHE_SIZE = 4096
+    
+    def __init__(self, compiled: List[Tuple[Predicate, Any]]):
+        """
+        Args:
+            compiled: (predicate, rule) pairs pre-sorted by priority
+        """
+        self.amount_rules = []
+        self.category_eq = {}
+        self.other_rules = []
+        self.size = len(compiled)
+        self._amount_columns = None
+        
+        # Per-index, so any rule change (which builds a new index) starts empty
+        self.match_cached = lru_cache(maxsize=self.MATCH_CACHE_SIZE)(self._match_values)
+        
+        for position, (predicate, rule) in enumerate(compiled):
+            if predicate is _never_match:
+                continue
+            if rule.field == 'category' and rule.operator == '==':
+                # First entry per value wins; later ones can never be reached
+                self.category_eq.setdefault(sys.intern(str(rule.value)), (position, rule))
+            elif rule.field == 'amount':
+                self.amount_rules.append((position, predicate, rule))
+            else:
+                self.other_rules.append((position, predicate, rule))
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def match(self, request: RequestView) -> Optional[Any]:
+        """
+        Find the highest-priority rule matching the request.
+        
+        Args:
+            request: RequestView of the request's fields
+        
+        Returns:
+            First matching rule or None if no rule matches
+        """
+        best_position, best = self._category_match(request)
+        
+        if request.amount is not None:
+            for position, predicate, rule in self.amount_rules:
+                if position >= best_position:
+                    break
+                if predicate(request):
+                    best_position, best = position, rule
+                    break
+        
+        return self._other_match(request, best_position, best)
+    
+    def _match_values(self, category: Optional[str], amount: Optional[float]) -> Optional[Any]:
+        """match() by field values; wrapped as match_cached(category, amount)."""
+        return self.match(RequestView(amount, category))
+    
+    def match_many(self, rows: List[RequestView]) -> List[Optional[Any]]:
+        """
+        Find the matching rule for each of several requests.
+        
+        With NumPy installed and a large enough batch, amount rules are
+        checked for all requests at once; otherwise each row goes through
+        match_cached, so repeated (category, amount) pairs skip the rules.
+        
+        Args:
+            rows: RequestViews of the requests' fields
+        
+        Returns:
+            First matching rule (or None) for each row, in order
+        """
+        if (np is None or not rows or not self.amount_rules
+                or len(rows) * len(self.amount_rules) < self.VECTORIZE_MIN_PAIRS):
+            match_cached = self.match_cached
+            return [match_cached(request.category, request.amount) for request in rows]
+        
+        results = []
+        for request, hit in zip(rows, self._first_amount_hits(rows)):
+            best_position, best = self._category_match(request)
+            if hit >= 0:
+                position, _, rule = self.amount_rules[hit]
+                if position < best_position:
+                    best_position, best = position, rule
+            results.append(self._other_match(request, best_position, best))
+        
+        return results
+    
+    def _category_match(self, request: RequestView) -> Tuple[int, Optional[Any]]:
+        """Return (position, rule) of the indexed category hit, if any."""
+        hit = self.category_eq.get(request.category)
+        if hit is not None:
+            return hit
+        return sys.maxsize, None
+    
+    def _other_match(self, request: RequestView, best_position: int, best: Optional[Any]) -> Optional[Any]:
+        """Check unindexed rules that outrank the best match so far."""
+        for position, predicate, rule in self.other_rules:
+            if position >= best_position:
+                break
+            if predicate(request):
+                return rule
+        
+        return best
+    
+    def _first_amount_hits(self, rows: List[RequestView]) -> List[int]:
+        """
+        Index into amount_rules of each row's first matching amount rule.
+        
+        Builds a (rows x amount rules) boolean matrix, one vectorized
+        comparison per operator, and takes the first True column per row.
+        
+        Returns:
+            Index per row, or -1 where no amount rule matches
+        """
+        if self._amount_columns is None:
+            self._amount_columns = _amount_columns(self.amount_rules)
+        
+        # None becomes NaN, which compares False: missing amounts match nothing
+        amounts = np.array([row.amount for row in rows], dtype=np.float64)[:, None]
+        
+        matches = np.zeros((len(rows), len(self.amount_rules)), dtype=bool)
+        for compare, columns, thresholds in self._amount_columns:
+            matches[:, columns] = compare(amounts, thresholds)
+        
+        hits = matches.argmax(axis=1)
+        hits[~matches.any(axis=1)] = -1
+        return hits.tolist()
+
 class RuleEngine:
     """
     Evaluates requests against rules using deterministic priority-based matching.
@@ -15,12 +240,85 @@ class RuleEngine:
     """
     
     # Safe operator mapping - NO EVAL OR EXEC
-    OPERATORS = {
-        '<': lambda a, b: a < b,
-        '<=': lambda a, b: a <= b,
-        '>': lambda a, b: a > b,
-        '==': lambda a, b: a == b,
-    }
+    OPERATORS = {symbol: _OP_FUNCS[op_code] for symbol, op_code in OP_CODES.items()}
+    
+    @staticmethod
+    def invalidate() -> None:
+        """
+        Drop cached rules so the next evaluation reloads them.
+        
+        Rule writes through the ORM invalidate automatically on commit; call
+        this after changing rules by other means (e.g. raw SQL).
+        """
+        # Imported here: rule_cache compiles its rules with RuleEngine
+        from services import rule_cache
+        rule_cache.invalidate()
+    
+    @staticmethod
+    def compile(rule) -> Predicate:
+        """
+        Compile a rule into a predicate over a RequestView.
+        
+        The field getter and operator are resolved and the rule value
+        converted once, so evaluating the predicate does no parsing.
+        
+        Args:
+            rule: Rule (or rule snapshot) to compile
+        
+        Returns:
+            Callable taking a RequestView and returning True on a match;
+            _never_match if the rule can't match anything
+        """
+        op_code = OP_CODES.get(rule.operator)
+        if op_code is None or rule.field not in RequestView.__slots__:
+            return _never_match
+        
+        compare = _OP_FUNCS[op_code]
+        
+        get_value = attrgetter(rule.field)
+        
+        if rule.field == 'amount':
+            try:
+                rule_value = float(rule.value)
+            except (ValueError, TypeError):
+                return _never_match
+        else:
+            # Category compares as strings. Interned so an interned request
+            # value matches on str =='s identity check
+            rule_value = sys.intern(str(rule.value))
+        
+        def matches(request: RequestView) -> bool:
+            value = get_value(request)
+            return value is not None and compare(value, rule_value)
+        
+        return matches
+    
+    @staticmethod
+    def compile_rules(rules: list) -> RuleIndex:
+        """
+        Compile rules and index them by field.
+        
+        Args:
+            rules: Rules pre-sorted by priority
+        
+        Returns:
+            RuleIndex over the compiled rules
+        """
+        return RuleIndex([(RuleEngine.compile(rule), rule) for rule in rules])
+    
+    @staticmethod
+    def evaluate_compiled(request: RequestView, compiled: RuleIndex) -> Optional[Any]:
+        """
+        Evaluate a request against precompiled rules.
+        
+        Args:
+            request: RequestView of the request's fields
+            compiled: RuleIndex from compile_rules
+        
+        Returns:
+            First matching rule or None if no rule matches
+        """
+        return compiled.match(request)
     
     @staticmethod
     def evaluate_request(request_data: Dict[str, Any], rules: list[Rule]) -> Optional[Rule]:
@@ -34,11 +332,7 @@ class RuleEngine:
         Returns:
             First matching Rule or None if no rule matches
         """
-        for rule in rules:
-            if RuleEngine._matches_rule(request_data, rule):
-                return rule
-        
-        return None
+        return RuleEngine.compile_rules(rules).match(RequestView.from_dict(request_data))
     
     @staticmethod
     def _matches_rule(request_data: Dict[str, Any], rule: Rule) -> bool:
@@ -52,32 +346,4 @@ class RuleEngine:
         Returns:
             True if request matches rule, False otherwise
         """
-        # Get the field value from request
-        field_value = request_data.get(rule.field)
-        
-        if field_value is None:
-            return False
-        
-        # Get the operator function
-        operator_func = RuleEngine.OPERATORS.get(rule.operator)
-        
-        if operator_func is None:
-            return False
-        
-        # Convert rule value to appropriate type based on field
-        try:
-            if rule.field == 'amount':
-                # For amount, convert to float
-                rule_value = float(rule.value)
-                field_value = float(field_value)
-            else:
-                # For category and other string fields, compare as strings
-                rule_value = str(rule.value)
-                field_value = str(field_value)
-            
-            # Apply operator
-            return operator_func(field_value, rule_value)
-        
-        except (ValueError, TypeError):
-            # If conversion fails, rule doesn't match
-            return False
+        return RuleEngine.compile(rule)(RequestView.from_dict(request_data))
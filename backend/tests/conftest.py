@@ -19,6 +19,7 @@ class TestConfig:
     TESTING = True
     DEBUG = False
     CORS_ORIGINS = ['http://localhost:5173']
+    METRICS_ENABLED = False
 
 @pytest.fixture
 def app():
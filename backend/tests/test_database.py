@@ -0,0 +1,88 @@
+"""
+Tests for database connection setup.
+"""
+import pytest
+from sqlalchemy import text
+from app import create_app
+from database import db
+from tests.conftest import TestConfig
+
+class TestSqlitePragmas:
+    """Test that SQLite connections are tuned for per-request commits."""
+
+    def test_file_database_uses_wal(self, tmp_path):
+        """Test that new connections run in WAL mode with synchronous=NORMAL."""
+        class FileConfig(TestConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'ruleguard.db'}"
+
+        app = create_app(FileConfig)
+
+        with app.app_context():
+            with db.engine.connect() as connection:
+                assert connection.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+                assert connection.execute(text('PRAGMA synchronous')).scalar() == 1  # NORMAL
+            db.engine.dispose()
+
+class TestRuleIndexes:
+    """Test that rule queries are served by indexes instead of sorts."""
+
+    def _plan(self, sql):
+        rows = db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}')).all()
+        return ' '.join(row[-1] for row in rows)
+
+    def test_priority_order_uses_index(self, app):
+        """Test that ordering all rules by priority needs no temp B-tree."""
+        plan = self._plan('SELECT id, field, operator, value, decision, priority FROM rules ORDER BY priority')
+
+        assert 'ix_rules_priority_id' in plan
+        assert 'TEMP B-TREE' not in plan
+
+    def test_field_filtered_priority_order_uses_index(self, app):
+        """Test that one field's rules stream in priority order from the index."""
+        plan = self._plan("SELECT id FROM rules WHERE field = 'amount' ORDER BY priority")
+
+        assert 'ix_rules_field_priority' in plan
+        assert 'TEMP B-TREE' not in plan
+
+class TestSessionDefaults:
+    """Test that sessions keep SQLAlchemy's default expiry and autoflush."""
+
+    def test_pending_rule_visible_to_query(self, app, db_session):
+        """Test that a query autoflushes rules added earlier in the session."""
+        from models import Rule
+
+        db_session.add(Rule(field='amount', operator='>', value='100', decision='APPROVE', priority=1))
+
+        assert Rule.query.count() == 1
+
+    def test_attributes_reloaded_after_commit(self, app, db_session):
+        """Test that committed objects see changes made outside the session."""
+        from models import Rule
+
+        rule = Rule(field='amount', operator='>', value='100', decision='APPROVE', priority=1)
+        db_session.add(rule)
+        db_session.commit()
+
+        assert rule.value == '100'
+
+        # Raw SQL: the ORM doesn't know the loaded value is now stale
+        db_session.execute(text("UPDATE rules SET value = '200' WHERE id = :id"), {'id': rule.id})
+        db_session.commit()
+
+        assert rule.value == '200'
+
+    def test_submit_request_skips_reload_after_commit(self, app, client):
+        """Test that submitting a request doesn't re-SELECT its rows after committing."""
+        from sqlalchemy import event
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            response = client.post('/api/requests', json={'amount': 50, 'category': 'office'})
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+
+        assert response.status_code == 201
+        assert not any(s.lstrip().upper().startswith('SELECT') and 'FROM requests' in s for s in statements)
+        assert not any(s.lstrip().upper().startswith('SELECT') and 'FROM decisions' in s for s in statements)
@@ -160,3 +160,50 @@ class TestDecisionService:
         assert '$750.00' in decision.explanation
         assert 'priority 5' in decision.explanation
         assert 'approved' in decision.explanation.lower()
+    
+    def test_evaluate_and_decide_many(self, app, db_session):
+        """Test that a batch of requests gets one decision each, in order."""
+        rule = Rule(
+            field='amount',
+            operator='>',
+            value='1000',
+            decision='REJECT',
+            priority=1
+        )
+        db_session.add(rule)
+        
+        requests = [
+            Request(amount=1500, category='travel'),
+            Request(amount=200, category='office'),
+            Request(amount=5000, category='equipment'),
+        ]
+        db_session.add_all(requests)
+        db_session.commit()
+        
+        decisions = DecisionService.evaluate_and_decide_many(requests)
+        
+        assert [d.request_id for d in decisions] == [r.id for r in requests]
+        assert [d.decision for d in decisions] == ['REJECTED', 'NEEDS_REVIEW', 'REJECTED']
+        assert all(d.id is not None for d in decisions)
+        assert Decision.query.count() == 3
+    
+    def test_preview_does_not_persist(self, client):
+        """Test that previewing a request returns its decision without saving rows."""
+        client.post('/api/rules',
+            json={'field': 'category', 'operator': '==', 'value': 'travel', 'decision': 'REJECT', 'priority': 1}
+        )
+        
+        response = client.post('/api/requests/preview', json={'amount': 250, 'category': 'travel'})
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['decision'] == 'REJECTED'
+        assert "category='travel'" in data['explanation']
+        assert Request.query.count() == 0
+        assert Decision.query.count() == 0
+    
+    def test_preview_validates_input(self, client):
+        """Test that previews reject the same invalid input as submissions."""
+        response = client.post('/api/requests/preview', json={'amount': -5, 'category': 'travel'})
+        
+        assert response.status_code == 400
@@ -63,6 +63,39 @@ class TestInvalidInput:
         data = json.loads(response.data)
         assert 'error' in data
     
+    def test_blank_category_rejected(self, client):
+        """Test that a whitespace-only category is rejected."""
+        response = client.post('/api/requests',
+            json={'amount': 500, 'category': '   '},
+            content_type='application/json'
+        )
+        
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert 'Validation failed' in data['error']
+    
+    def test_unknown_request_field_rejected(self, client):
+        """Test that unexpected fields are rejected."""
+        response = client.post('/api/requests',
+            json={'amount': 500, 'category': 'office', 'id': 7},
+            content_type='application/json'
+        )
+        
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert 'error' in data
+    
+    def test_malformed_json_rejected(self, client):
+        """Test that a body that is not valid JSON is rejected."""
+        response = client.post('/api/requests',
+            data='{"amount": 500,',
+            content_type='application/json'
+        )
+        
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert 'error' in data
+    
     def test_invalid_rule_field_rejected(self, client):
         """Test that invalid rule field is rejected."""
         response = client.post('/api/rules',
@@ -198,3 +231,61 @@ class TestEdgeCases:
         )
         
         assert response2.status_code == 201
+    
+    def test_get_request_returns_latest_decision(self, client):
+        """Test that the detail view includes the request's decision."""
+        response = client.post('/api/requests',
+            json={'amount': 500, 'category': 'office'},
+            content_type='application/json'
+        )
+        created = json.loads(response.data)
+        
+        response = client.get(f"/api/requests/{created['request']['id']}")
+        
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['request']['id'] == created['request']['id']
+        assert data['decision']['id'] == created['decision']['id']
+    
+    def test_get_missing_request_returns_404(self, client):
+        """Test that an unknown request ID returns 404."""
+        response = client.get('/api/requests/9999')
+        
+        assert response.status_code == 404
+        data = json.loads(response.data)
+        assert 'error' in data
+
+class TestErrorResponses:
+    """Test constant success and error payloads."""
+    
+    def test_delete_rule_message(self, client):
+        """Test the delete confirmation payload."""
+        response = client.post('/api/rules',
+            json={'field': 'amount', 'operator': '>', 'value': '1000', 'decision': 'APPROVE', 'priority': 1}
+        )
+        rule_id = json.loads(response.data)['id']
+        
+        response = client.delete(f'/api/rules/{rule_id}')
+        
+        assert response.status_code == 200
+        assert json.loads(response.data) == {'message': 'Rule deleted successfully'}
+        assert 'X-Request-ID' in response.headers
+    
+    def test_delete_missing_rule_returns_404(self, client):
+        """Test that deleting an unknown rule returns 404."""
+        response = client.delete('/api/rules/9999')
+        
+        assert response.status_code == 404
+    
+    def test_internal_error_hides_details(self, client, monkeypatch):
+        """Test that 500 responses don't leak exception text."""
+        from services.decision_service import DecisionService
+        
+        def fail(request):
+            raise RuntimeError('secret connection string')
+        monkeypatch.setattr(DecisionService, 'evaluate_and_decide', fail)
+        
+        response = client.post('/api/requests', json={'amount': 500, 'category': 'office'})
+        
+        assert response.status_code == 500
+        assert json.loads(response.data) == {'error': 'Internal server error'}
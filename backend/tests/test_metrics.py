@@ -0,0 +1,84 @@
+"""
+Tests for metrics collection.
+"""
+import pytest
+from app import setup_metrics_tracking
+from metrics import MetricsCollector, metrics_collector
+
+class TestMetricsCollector:
+    """Test metrics collector bookkeeping."""
+
+    def test_average_response_time(self):
+        """Test that the average covers all recorded samples."""
+        collector = MetricsCollector()
+        for duration in [10.0, 20.0, 30.0]:
+            collector.record_response_time(duration)
+
+        response_times = collector.get_metrics()['response_time_ms']
+        assert response_times['average'] == 20.0
+        assert response_times['samples'] == 3
+
+    def test_response_time_window_drops_oldest(self):
+        """Test that only the most recent window of samples is averaged."""
+        collector = MetricsCollector()
+        window = MetricsCollector.RESPONSE_TIME_WINDOW
+
+        for _ in range(window):
+            collector.record_response_time(1000.0)
+        for _ in range(window):
+            collector.record_response_time(5.0)
+
+        response_times = collector.get_metrics()['response_time_ms']
+        assert response_times['average'] == 5.0
+        assert response_times['samples'] == window
+
+    def test_reset_clears_response_times(self):
+        """Test that reset empties the response time window."""
+        collector = MetricsCollector()
+        collector.record_response_time(50.0)
+        collector.reset()
+
+        response_times = collector.get_metrics()['response_time_ms']
+        assert response_times['average'] == 0
+        assert response_times['samples'] == 0
+
+    def test_metrics_json_reused_within_ttl(self):
+        """Test that the serialized snapshot is cached until it expires."""
+        collector = MetricsCollector(cache_ttl=60)
+        first = collector.get_metrics_json()
+        collector.record_request('GET', '/api/rules')
+
+        assert collector.get_metrics_json() is first
+
+    def test_reset_invalidates_metrics_json(self):
+        """Test that reset drops the cached snapshot."""
+        collector = MetricsCollector(cache_ttl=60)
+        collector.record_error(404)
+        first = collector.get_metrics_json()
+        collector.reset()
+
+        assert collector.get_metrics_json() != first
+
+    def test_metrics_endpoint_returns_json(self, client):
+        """Test that the metrics endpoint serves the encoded snapshot."""
+        response = client.get('/api/metrics')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert 'total_requests' in response.get_json()
+
+    def test_requests_counted_by_route(self, app):
+        """Test that per-ID paths are counted under their route pattern."""
+        setup_metrics_tracking(app)
+        metrics_collector.reset()
+
+        client = app.test_client()
+        client.get('/api/requests/1')
+        client.get('/api/requests/2')
+        client.get('/no/such/path')
+
+        counts = metrics_collector.get_metrics()['requests_by_endpoint']
+        assert counts == {
+            'GET /api/requests/<int:request_id>': 2,
+            'GET unmatched': 1,
+        }
@@ -0,0 +1,21 @@
+"""
+Tests for request ID middleware.
+"""
+import pytest
+
+class TestRequestId:
+    """Test request ID generation and propagation."""
+
+    def test_request_id_generated(self, client):
+        """Test that a request ID is generated when none is supplied."""
+        first = client.get('/api/rules').headers['X-Request-ID']
+        second = client.get('/api/rules').headers['X-Request-ID']
+
+        assert len(first) == 16
+        assert first != second
+
+    def test_client_request_id_echoed(self, client):
+        """Test that a client-supplied request ID is kept."""
+        response = client.get('/api/rules', headers={'X-Request-ID': 'trace-123'})
+
+        assert response.headers['X-Request-ID'] == 'trace-123'
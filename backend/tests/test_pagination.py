@@ -0,0 +1,72 @@
+"""
+Tests for paginated list endpoints.
+"""
+import pytest
+import json
+
+class TestPagination:
+    """Test keyset pagination on list endpoints."""
+
+    def _create_rules(self, client, priorities):
+        for priority in priorities:
+            response = client.post('/api/rules',
+                json={
+                    'field': 'amount',
+                    'operator': '>',
+                    'value': '1000',
+                    'decision': 'APPROVE',
+                    'priority': priority
+                },
+                content_type='application/json'
+            )
+            assert response.status_code == 201
+
+    def test_rules_paged_in_priority_order(self, client):
+        """Test that walking the cursor returns every rule once, in order."""
+        self._create_rules(client, [3, 1, 2, 1, 0])
+
+        seen = []
+        cursor = None
+        while True:
+            url = '/api/rules?limit=2' + (f'&cursor={cursor}' if cursor else '')
+            response = client.get(url)
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert len(data['items']) <= 2
+            seen.extend(data['items'])
+            cursor = data['next_cursor']
+            if cursor is None:
+                break
+
+        assert [r['priority'] for r in seen] == [0, 1, 1, 2, 3]
+        assert len({r['id'] for r in seen}) == 5
+
+    def test_requests_paged_newest_first(self, client):
+        """Test that requests are listed newest first across pages."""
+        for amount in [100, 200, 300]:
+            client.post('/api/requests',
+                json={'amount': amount, 'category': 'office'},
+                content_type='application/json'
+            )
+
+        first = json.loads(client.get('/api/requests?limit=2').data)
+        assert [r['amount'] for r in first['items']] == [300, 200]
+        assert first['next_cursor'] is not None
+
+        second = json.loads(client.get(f"/api/requests?limit=2&cursor={first['next_cursor']}").data)
+        assert [r['amount'] for r in second['items']] == [100]
+        assert second['next_cursor'] is None
+
+    def test_invalid_cursor_rejected(self, client):
+        """Test that a garbage cursor is rejected."""
+        response = client.get('/api/rules?cursor=not-a-cursor')
+
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert 'error' in data
+
+    def test_invalid_limit_rejected(self, client):
+        """Test that a non-positive limit is rejected."""
+        response = client.get('/api/requests?limit=0')
+
+        assert response.status_code == 400
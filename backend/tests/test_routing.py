@@ -0,0 +1,53 @@
+"""
+Tests for cached static route matching.
+"""
+import pytest
+
+class TestCachedRouting:
+    """Test that route caching doesn't change matching behavior."""
+
+    def test_static_route_cached(self, app, client):
+        """Test that a static path is cached after its first match."""
+        client.get('/api/rules')
+        client.get('/api/rules')
+
+        cached = app.url_map.static_match_cache.values()
+        assert 'rules.list_rules' in {rule.endpoint for rule in cached}
+
+    def test_dynamic_route_not_cached(self, app, client):
+        """Test that routes with converters are matched normally."""
+        client.get('/api/requests/1')
+        client.get('/api/requests/2')
+
+        cached = app.url_map.static_match_cache.values()
+        assert 'requests.get_request' not in {rule.endpoint for rule in cached}
+
+    def test_cached_path_respects_method(self, client):
+        """Test that a cached GET match doesn't leak into other methods."""
+        client.get('/api/rules')
+
+        assert client.put('/api/rules').status_code == 405
+        assert client.get('/api/unknown').status_code == 404
+
+    def test_host_header_not_part_of_cache_key(self, app, client):
+        """Test that arbitrary Host headers can't fill the cache or disable it."""
+        cache = app.url_map.static_match_cache
+
+        for i in range(app.url_map.MAX_CACHED_ROUTES + 100):
+            client.get('/api/rules', headers={'Host': f'attacker-{i}.example'})
+
+        assert len(cache) == 1
+        assert client.get('/api/rules', headers={'Host': 'localhost'}).status_code == 200
+        assert ('/api/rules', 'GET', False) in cache
+
+    def test_cache_evicts_least_recently_used(self, app, client, monkeypatch):
+        """Test that a full cache evicts old entries instead of refusing new ones."""
+        monkeypatch.setattr(app.url_map, 'MAX_CACHED_ROUTES', 2)
+        cache = app.url_map.static_match_cache
+
+        client.get('/api/rules')
+        client.get('/api/requests')
+        client.get('/api/rules')
+        client.get('/api/metrics')
+
+        assert list(cache) == [('/api/rules', 'GET', False), ('/api/metrics', 'GET', False)]
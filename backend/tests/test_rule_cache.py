@@ -0,0 +1,228 @@
+"""
+Tests for the per-process rule cache.
+"""
+import pytest
+import json
+from models import Rule, Request
+from services import rule_cache
+from services.rule_engine import RequestView
+
+def _make_rule(priority, value='1000'):
+    return Rule(field='amount', operator='>', value=value, decision='APPROVE', priority=priority)
+
+class TestRuleCache:
+    """Test rule cache loading and invalidation."""
+
+    def test_rules_reused_between_reads(self, app, db_session):
+        """Test that repeated reads return the same cached list."""
+        db_session.add(_make_rule(1))
+        db_session.commit()
+
+        first = rule_cache.get_rules()
+        assert rule_cache.get_rules() is first
+        assert [r.priority for r in first] == [1]
+
+    def test_commit_invalidates(self, app, db_session):
+        """Test that committing a new rule is visible on the next read."""
+        db_session.add(_make_rule(2))
+        db_session.commit()
+        assert [r.priority for r in rule_cache.get_rules()] == [2]
+
+        db_session.add(_make_rule(1))
+        db_session.commit()
+        assert [r.priority for r in rule_cache.get_rules()] == [1, 2]
+
+    def test_bulk_delete_invalidates(self, app, db_session):
+        """Test that bulk statements against rules also invalidate."""
+        db_session.add(_make_rule(1))
+        db_session.commit()
+        assert len(rule_cache.get_rules()) == 1
+
+        Rule.query.delete()
+        db_session.commit()
+        assert rule_cache.get_rules() == []
+
+    def test_cached_rules_survive_session_expiry(self, app, db_session):
+        """Test that cached entries stay readable after commits expire ORM state."""
+        db_session.add(_make_rule(1, value='250'))
+        db_session.commit()
+
+        rules = rule_cache.get_rules()
+        db_session.expire_all()
+        db_session.commit()
+
+        assert rules[0].value == '250'
+
+    def test_rule_routes_keep_cache_coherent(self, client):
+        """Test that rules created and deleted via the API take effect immediately."""
+        response = client.post('/api/rules',
+            json={'field': 'amount', 'operator': '>', 'value': '100', 'decision': 'REJECT', 'priority': 0},
+            content_type='application/json'
+        )
+        rule_id = json.loads(response.data)['id']
+
+        response = client.post('/api/requests', json={'amount': 500, 'category': 'office'})
+        assert json.loads(response.data)['decision']['decision'] == 'REJECTED'
+
+        client.delete(f'/api/rules/{rule_id}')
+
+        response = client.post('/api/requests', json={'amount': 500, 'category': 'office'})
+        assert json.loads(response.data)['decision']['decision'] == 'NEEDS_REVIEW'
+
+    def test_rules_reloaded_after_max_age(self, app, db_session, monkeypatch):
+        """Test that cached rules expire so other processes' writes are seen."""
+        db_session.add(_make_rule(1))
+        db_session.commit()
+        first = rule_cache.get_rules()
+
+        monkeypatch.setattr(rule_cache, '_expires_at', 0.0)
+
+        assert rule_cache.get_rules() is not first
+
+    def test_listed_rules_follow_rule_changes(self, app, client, db_session):
+        """Test that cached serialized rules are dropped when rules change."""
+        rule = _make_rule(1, value='100')
+        db_session.add(rule)
+        db_session.commit()
+        assert client.get('/api/rules').get_json()['items'][0]['value'] == '100'
+
+        rule.value = '200'
+        db_session.commit()
+        assert client.get('/api/rules').get_json()['items'][0]['value'] == '200'
+
+    def test_version_bumped_on_rule_change(self, app, db_session):
+        """Test that the rules version changes when rules are written."""
+        before = rule_cache.version()
+
+        db_session.add(_make_rule(1))
+        db_session.commit()
+
+        assert rule_cache.version() > before
+
+    def test_engine_invalidate_forces_reload(self, app, db_session):
+        """Test that RuleEngine.invalidate drops the cached list."""
+        from services.rule_engine import RuleEngine
+
+        db_session.add(_make_rule(1))
+        db_session.commit()
+        first = rule_cache.get_rules()
+        before = rule_cache.version()
+
+        RuleEngine.invalidate()
+
+        assert rule_cache.version() == before + 1
+        assert rule_cache.get_rules() is not first
+
+    def test_snapshot_precomputes_decision_and_condition(self, app, db_session):
+        """Test that cached rules carry their final decision and condition text."""
+        db_session.add(Rule(field='category', operator='==', value='travel', decision='REJECT', priority=1))
+        db_session.add(_make_rule(2))
+        db_session.commit()
+
+        category_rule, amount_rule = rule_cache.get_rules()
+
+        assert category_rule.final_decision == 'REJECTED'
+        assert category_rule.condition == "category == 'travel'"
+        assert amount_rule.final_decision == 'APPROVED'
+        assert amount_rule.condition == 'amount > $1000'
+
+        request = Request(amount=1234.5, category='travel')
+        assert category_rule.explanation_template % (category_rule.getter(request),) == (
+            "Request rejected based on rule: category == 'travel'. "
+            "Your request has category='travel', which matches this rule (priority 1)."
+        )
+        assert amount_rule.explanation_template % (amount_rule.getter(request),) == (
+            "Request approved based on rule: amount > $1000. "
+            "Your request has amount=$1234.50, which matches this rule (priority 2)."
+        )
+
+    def test_explanation_template_escapes_rule_text(self, app, db_session):
+        """Test that % in a rule value doesn't break the explanation template."""
+        db_session.add(Rule(field='category', operator='==', value='100%', decision='REVIEW', priority=1))
+        db_session.commit()
+
+        (rule,) = rule_cache.get_rules()
+
+        assert rule.explanation_template % ('100%',) == (
+            "Request needs_review based on rule: category == '100%'. "
+            "Your request has category='100%', which matches this rule (priority 1)."
+        )
+
+    def test_committed_writes_patch_cache_without_reload(self, app, db_session, monkeypatch):
+        """Test that single-rule writes are applied to the cached list in place of a reload."""
+        first, second = _make_rule(1), _make_rule(3)
+        db_session.add_all([first, second])
+        db_session.commit()
+        rule_cache.get_rules()
+
+        def fail():
+            raise AssertionError('rules reloaded from the database')
+        monkeypatch.setattr(rule_cache, '_load', fail)
+
+        db_session.add(_make_rule(2, value='500'))
+        db_session.commit()
+        assert [r.priority for r in rule_cache.get_rules()] == [1, 2, 3]
+
+        first.priority = 4
+        db_session.delete(second)
+        db_session.commit()
+        assert [r.priority for r in rule_cache.get_rules()] == [2, 4]
+        assert rule_cache.get_compiled().match(RequestView(600, 'office')).value == '500'
+
+    def test_rolled_back_savepoint_not_replayed(self, app, db_session):
+        """Test that rule writes undone by a savepoint rollback never reach the cache."""
+        db_session.add(_make_rule(1))
+        db_session.commit()
+        rule_cache.get_rules()
+
+        savepoint = db_session.begin_nested()
+        db_session.add(_make_rule(2))
+        db_session.flush()
+        savepoint.rollback()
+        db_session.commit()
+
+        assert [r.priority for r in rule_cache.get_rules()] == [1]
+
+    def test_load_skips_orm_execution(self, app, db_session):
+        """Test that reloading rules doesn't go through ORM execution or flush."""
+        from sqlalchemy import event
+        from sqlalchemy.orm import Session
+
+        db_session.add(_make_rule(1))
+        db_session.commit()
+        db_session.add(_make_rule(2))  # Pending, must not be flushed by the read
+
+        calls = []
+        listener = lambda state: calls.append(state)
+        event.listen(Session, 'do_orm_execute', listener)
+        try:
+            rule_cache.invalidate()
+            rules = rule_cache.get_rules()
+        finally:
+            event.remove(Session, 'do_orm_execute', listener)
+
+        assert [r.priority for r in rules] == [1]
+        assert calls == []
+        assert len(db_session.new) == 1
+
+    def test_listed_rules_follow_reused_id_from_other_worker(self, app, client, db_session):
+        """Test that a rule re-created under a reused id by another process isn't served stale."""
+        from sqlalchemy import text
+
+        db_session.add_all([_make_rule(1, value='100'), _make_rule(2, value='200')])
+        db_session.commit()
+        assert client.get('/api/rules').get_json()['items'][1]['value'] == '200'
+
+        # Raw SQL on the connection fires no ORM events, like a write from another worker
+        connection = db_session.connection()
+        max_id = connection.execute(text('SELECT MAX(id) FROM rules')).scalar()
+        connection.execute(text('DELETE FROM rules WHERE id = :id'), {'id': max_id})
+        connection.execute(text(
+            "INSERT INTO rules (field, operator, value, decision, priority) VALUES ('amount', '<', '300', 'REJECT', 2)"
+        ))
+        assert connection.execute(text('SELECT MAX(id) FROM rules')).scalar() == max_id
+        db_session.commit()
+
+        item = client.get('/api/rules').get_json()['items'][1]
+        assert item['id'] == max_id
+        assert (item['operator'], item['value'], item['decision']) == ('<', '300', 'REJECT')
@@ -3,7 +3,7 @@ Tests for rule evaluation logic.
 """
 import pytest
 from models import Rule
-from services.rule_engine import RuleEngine
+from services.rule_engine import RuleEngine, RequestView
 
 class TestRuleEngine:
     """Test rule engine evaluation logic."""
@@ -115,3 +115,147 @@ class TestRuleEngine:
         
         result = RuleEngine._matches_rule(request_data, rule)
         assert result is False
+    
+    def test_compile_matches_like_rule(self):
+        """Test that compiled predicates agree with the rule condition."""
+        rule = Rule(field='amount', operator='<=', value='1000', decision='APPROVE', priority=1)
+        predicate = RuleEngine.compile(rule)
+        
+        assert predicate(RequestView(1000, 'office')) is True
+        assert predicate(RequestView('999.5', 'office')) is True
+        assert predicate(RequestView(1000.01, 'office')) is False
+        assert predicate(RequestView(None, 'office')) is False
+    
+    def test_compile_invalid_rule_never_matches(self):
+        """Test that invalid fields, operators and values compile to the never-match sentinel."""
+        from services.rule_engine import _never_match
+        
+        bad_field = Rule(field='description', operator='==', value='x', decision='APPROVE', priority=1)
+        bad_operator = Rule(field='amount', operator='!=', value='1000', decision='APPROVE', priority=1)
+        bad_value = Rule(field='amount', operator='>', value='lots', decision='APPROVE', priority=1)
+        
+        assert RuleEngine.compile(bad_field) is _never_match
+        assert RuleEngine.compile(bad_operator) is _never_match
+        assert RuleEngine.compile(bad_value) is _never_match
+    
+    def test_indexed_category_rule_respects_priority(self):
+        """Test that an indexed category rule only wins when it outranks amount rules."""
+        rules = [
+            Rule(field='amount', operator='>', value='1000', decision='APPROVE', priority=1),
+            Rule(field='category', operator='==', value='travel', decision='REJECT', priority=2),
+            Rule(field='amount', operator='>', value='100', decision='REVIEW', priority=3),
+        ]
+        
+        assert RuleEngine.evaluate_request({'amount': 1500, 'category': 'travel'}, rules).priority == 1
+        assert RuleEngine.evaluate_request({'amount': 500, 'category': 'travel'}, rules).priority == 2
+        assert RuleEngine.evaluate_request({'amount': 500, 'category': 'office'}, rules).priority == 3
+    
+    def test_index_agrees_with_linear_scan(self):
+        """Test that indexed evaluation returns the same rule as checking each rule in order."""
+        import random
+        rng = random.Random(1234)
+        
+        for _ in range(50):
+            rules = []
+            for priority in range(rng.randint(0, 12)):
+                if rng.random() < 0.5:
+                    rules.append(Rule(field='amount', operator=rng.choice(['<', '<=', '>', '==']),
+                        value=str(rng.choice([100, 500, 1000])), decision='APPROVE', priority=priority))
+                else:
+                    rules.append(Rule(field='category', operator=rng.choice(['==', '==', '<']),
+                        value=rng.choice(['office', 'travel']), decision='REJECT', priority=priority))
+            
+            for amount in (50, 100, 500, 999, 1000, 5000):
+                for category in ('office', 'travel', 'meals'):
+                    request_data = {'amount': amount, 'category': category}
+                    expected = next((r for r in rules if RuleEngine._matches_rule(request_data, r)), None)
+                    assert RuleEngine.evaluate_request(request_data, rules) is expected
+    
+    def test_match_many_agrees_with_match(self, monkeypatch):
+        """Test that batch matching returns the same rules as matching one at a time."""
+        from services.rule_engine import RuleIndex
+        
+        rules = [
+            Rule(field='category', operator='==', value='travel', decision='REJECT', priority=1),
+            Rule(field='amount', operator='>', value='1000', decision='APPROVE', priority=2),
+            Rule(field='amount', operator='==', value='500', decision='REVIEW', priority=3),
+            Rule(field='amount', operator='<=', value='100', decision='APPROVE', priority=4),
+        ]
+        index = RuleEngine.compile_rules(rules)
+        rows = [
+            RequestView(amount, category)
+            for amount in (50, 100, 500, 750, 1000.5, None, 'bad')
+            for category in ('travel', 'office')
+        ]
+        expected = [index.match(row) for row in rows]
+        
+        assert index.match_many(rows) == expected
+        
+        # Force the vectorized path when NumPy is available
+        monkeypatch.setattr(RuleIndex, 'VECTORIZE_MIN_PAIRS', 0)
+        assert index.match_many(rows) == expected
+    
+    def test_decoded_category_interned(self):
+        """Test that decoded request categories share the interned rule value."""
+        import msgspec
+        from schemas.structs import RequestIn
+        
+        rule = Rule(field='category', operator='==', value=''.join(['tra', 'vel']), decision='REJECT', priority=1)
+        index = RuleEngine.compile_rules([rule])
+        data = msgspec.json.decode(b'{"amount": 10, "category": "travel"}', type=RequestIn)
+        
+        (key,) = index.category_eq
+        assert data.category is key
+        assert index.match(RequestView(data.amount, data.category)) is rule
+    
+    def test_match_cached_reuses_results(self):
+        """Test that repeated (category, amount) inputs are answered from the cache."""
+        rules = [
+            Rule(field='amount', operator='>', value='1000', decision='APPROVE', priority=1),
+        ]
+        index = RuleEngine.compile_rules(rules)
+        
+        results = index.match_many([RequestView(1500, 'office'), RequestView(1500, 'office'), RequestView(10, 'office')])
+        
+        assert results == [rules[0], rules[0], None]
+        info = index.match_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+        
+        # A recompiled rule set starts with an empty cache
+        assert RuleEngine.compile_rules(rules).match_cached.cache_info().currsize == 0
+    
+    def test_op_codes_index_matching_functions(self):
+        """Test that each operator symbol dispatches to the right comparison."""
+        from services.rule_engine import OP_CODES, _OP_FUNCS
+        
+        expected = {'<': (True, False, False), '<=': (True, True, False), '>': (False, False, True), '==': (False, True, False)}
+        for symbol, results in expected.items():
+            compare = _OP_FUNCS[OP_CODES[symbol]]
+            assert (compare(1, 2), compare(2, 2), compare(3, 2)) == results
+    
+    def test_many_category_values_resolved_by_lookup(self):
+        """Test that long runs of category equality rules are indexed, not scanned."""
+        rules = [
+            Rule(field='category', operator='==', value=f'cat-{i}', decision='REJECT', priority=i)
+            for i in range(500)
+        ]
+        rules.insert(250, Rule(field='amount', operator='>', value='1000', decision='APPROVE', priority=250))
+        index = RuleEngine.compile_rules(rules)
+        
+        assert len(index.category_eq) == 500
+        assert index.other_rules == []
+        assert index.match(RequestView(5000, 'cat-499')) is rules[250]
+        assert index.match(RequestView(5000, 'cat-10')).value == 'cat-10'
+        assert index.match(RequestView(10, 'cat-499')).value == 'cat-499'
+    
+    def test_match_many_without_amount_rules_or_rows(self, monkeypatch):
+        """Test that batch matching handles empty inputs even with vectorizing forced on."""
+        from services.rule_engine import RuleIndex
+        monkeypatch.setattr(RuleIndex, 'VECTORIZE_MIN_PAIRS', 0)
+        
+        rule = Rule(field='category', operator='==', value='travel', decision='REJECT', priority=1)
+        index = RuleEngine.compile_rules([rule])
+        
+        assert index.match_many([RequestView(50, 'travel'), RequestView(50, 'office')]) == [rule, None]
+        assert index.match_many([]) == []
+        assert RuleEngine.compile_rules([]).match_many([RequestView(50, 'travel')]) == [None]
@@ -0,0 +1,36 @@
+"""
+Tests for precompiled schema dumps.
+"""
+import pytest
+from datetime import datetime
+from models import Request, Rule, Decision
+from schemas import (
+    RequestSchema, request_schema,
+    RuleSchema, rule_schema,
+    DecisionSchema, decision_schema
+)
+
+class TestPrecompiledDump:
+    """Test that precompiled dumps match Marshmallow's own output."""
+
+    @pytest.mark.parametrize('schema_class, schema, obj', [
+        (RequestSchema, request_schema,
+         Request(id=1, amount=1500, category='travel', description=None, created_at=datetime(2024, 1, 2, 3, 4, 5))),
+        (RuleSchema, rule_schema,
+         Rule(id=2, field='amount', operator='>', value='1000', decision='APPROVE', priority=1)),
+        (DecisionSchema, decision_schema,
+         Decision(id=3, request_id=1, decision='APPROVED', explanation='ok', rule_id=None, created_at=datetime(2024, 1, 2))),
+    ])
+    def test_matches_marshmallow(self, app, schema_class, schema, obj):
+        """Test single and many dumps against an unpatched schema."""
+        reference = schema_class()
+
+        assert schema.dump(obj) == reference.dump(obj)
+        assert schema.dump([obj, obj], many=True) == reference.dump([obj, obj], many=True)
+
+    def test_amount_dumped_as_float(self, app):
+        """Test that integer amounts are converted like fields.Float does."""
+        data = request_schema.dump(Request(id=1, amount=5, category='office'))
+
+        assert isinstance(data['amount'], float)
+        assert data['created_at'] is None
@@ -67,17 +67,32 @@ export async function submitRequest(
     return response.json();
 }
 
+export interface Page<T> {
+    items: T[];
+    next_cursor: string | null;
+}
+
 /**
- * Get all rules ordered by priority.
+ * Get all rules ordered by priority, following pagination cursors.
  */
 export async function getRules(): Promise<Rule[]> {
-    const response = await fetchWithTimeout(`${API_BASE_URL}/rules`);
+    const rules: Rule[] = [];
+    let cursor: string | null = null;
 
-    if (!response.ok) {
-        throw new Error('Failed to fetch rules');
-    }
+    do {
+        const query = cursor ? `?limit=200&cursor=${encodeURIComponent(cursor)}` : '?limit=200';
+        const response = await fetchWithTimeout(`${API_BASE_URL}/rules${query}`);
 
-    return response.json();
+        if (!response.ok) {
+            throw new Error('Failed to fetch rules');
+        }
+
+        const page: Page<Rule> = await response.json();
+        rules.push(...page.items);
+        cursor = page.next_cursor;
+    } while (cursor);
+
+    return rules;
 }
 
 /**